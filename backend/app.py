@@ -1,12 +1,20 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
 from config import Config
+from utils.logging_config import configure_logging
+from utils.json_provider import OrjsonProvider
 import atexit
 
 def create_app():
+    # Route log output through a background listener thread
+    configure_logging()
+    
     app = Flask(__name__)
     app.config.from_object(Config)
     
+    # Serialize JSON responses with orjson
+    app.json = OrjsonProvider(app)
+    
     # Enable CORS
     CORS(app)
     
@@ -31,6 +39,10 @@ def create_app():
     app.register_blueprint(automation_bp, url_prefix='/api/automation')
     app.register_blueprint(admin_bp, url_prefix='/api/admin')
     
+    # Load fonts and PDF libraries before the first certificate request
+    from services.certificate_service import warm_up_renderer
+    warm_up_renderer()
+    
     return app
 
 if __name__ == '__main__':
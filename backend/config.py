@@ -10,6 +10,9 @@ class Config:
     
     # Mock Mode Configuration
     MOCK_MODE = os.getenv("MOCK_MODE", "false").lower() == "true"
+    MOCK_BATCH_WORKERS = int(os.getenv("MOCK_BATCH_WORKERS", "16"))
+    MOCK_SIMULATE_LATENCY = os.getenv("MOCK_SIMULATE_LATENCY", "true").lower() == "true"
+    MOCK_LOG_FAILED_SENDS = os.getenv("MOCK_LOG_FAILED_SENDS", "true").lower() == "true"
     
     # External Services
     SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
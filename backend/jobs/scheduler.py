@@ -78,6 +78,17 @@ class JobScheduler:
             self.scheduler.shutdown(wait=True)
             logger.info("[Scheduler] ✓ Scheduler shut down successfully")
     
+    def enqueue(self, func, job_id: str, name: str, **kwargs):
+        """Run a one-off job on the scheduler's worker pool as soon as possible"""
+        self.scheduler.add_job(
+            func=func,
+            trigger='date',
+            id=job_id,
+            name=name,
+            kwargs=kwargs,
+            replace_existing=True
+        )
+    
     def _log_scheduled_jobs(self):
         """Log all scheduled jobs"""
         jobs = self.scheduler.get_jobs()
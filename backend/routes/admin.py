@@ -1,7 +1,6 @@
 from flask import Blueprint, request, jsonify
 from utils.supabase_client import supabase
-from services.payment_service import PaymentService
-from services.mock_payment_service import MockPaymentService
+from services.payment_service import get_payment_service
 from services.certificate_service import get_certificate_service
 from services.notification_service import get_notification_service
 from services.support_ticket_service import get_support_ticket_service
@@ -12,12 +11,8 @@ from datetime import datetime, timezone
 
 admin_bp = Blueprint('admin', __name__)
 
-# Use mock payment service if in mock mode
-if Config.MOCK_MODE:
-    payment_service = MockPaymentService()
-    print("[MOCK MODE] Using mock payment service")
-else:
-    payment_service = PaymentService()
+# Mock or real Instamojo service, chosen once by MOCK_MODE
+payment_service = get_payment_service()
 
 
 def _utc_iso() -> str:
@@ -316,6 +311,77 @@ def generate_certificate():
         return jsonify({"error": str(e)}), 500
 
 
+@admin_bp.route('/certificates/generate-async', methods=['POST'])
+def generate_certificate_async():
+    """Queue a certificate for background generation"""
+    try:
+        data = request.json
+        student_id = data.get('student_id')
+        course_name = data.get('course_name')
+        
+        if not student_id or not course_name:
+            return jsonify({"error": "student_id and course_name are required"}), 400
+        
+        certificate_service = get_certificate_service(supabase)
+        result = certificate_service.enqueue_certificate(
+            student_id=student_id,
+            course_name=course_name,
+            completion_date=data.get('completion_date'),
+            grade=data.get('grade'),
+            admin_id=data.get('admin_id')
+        )
+        
+        if result['success']:
+            return jsonify(result), 202
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@admin_bp.route('/certificates/<certificate_id>/status', methods=['GET'])
+def get_certificate_status(certificate_id):
+    """Get the status of a queued certificate"""
+    try:
+        certificate_service = get_certificate_service(supabase)
+        job = certificate_service.get_certificate_job(certificate_id)
+        
+        if job:
+            return jsonify(job), 200
+        else:
+            return jsonify({"error": "Certificate job not found"}), 404
+            
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@admin_bp.route('/certificates/generate-bulk', methods=['POST'])
+def generate_certificates_bulk():
+    """Generate certificates for several students in one pass"""
+    try:
+        data = request.json
+        entries = data.get('certificates')
+        admin_id = data.get('admin_id')
+        
+        if not entries or not isinstance(entries, list):
+            return jsonify({"error": "certificates must be a non-empty list"}), 400
+        
+        certificate_service = get_certificate_service(supabase)
+        result = certificate_service.generate_certificates_bulk(
+            entries=entries,
+            admin_id=admin_id
+        )
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @admin_bp.route('/certificates', methods=['GET'])
 def get_all_certificates():
     """Get all certificates (admin view)"""
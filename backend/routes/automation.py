@@ -1,8 +1,7 @@
 from flask import Blueprint, request, jsonify
-from services.email_service import EmailService
+from services.email_service import EmailService, get_email_service
 from services.whatsapp_service import WhatsAppService
 from services.voice_service import VoiceService
-from services.mock_email_service import MockEmailService
 from services.mock_whatsapp_service import MockWhatsAppService
 from services.mock_voice_service import MockVoiceService
 from config import Config
@@ -11,7 +10,7 @@ automation_bp = Blueprint('automation', __name__)
 
 # Use mock services if in mock mode
 if Config.MOCK_MODE:
-    email_service = MockEmailService()
+    email_service = get_email_service()
     whatsapp_service = MockWhatsAppService()
     voice_service = MockVoiceService()
     print("[MOCK MODE] Using mock services for automation")
@@ -1,17 +1,12 @@
 from flask import Blueprint, request, jsonify
-from services.payment_service import PaymentService
-from services.mock_payment_service import MockPaymentService
+from services.payment_service import get_payment_service
 from utils.supabase_client import supabase
 from config import Config
 
 webhooks_bp = Blueprint('webhooks', __name__)
 
-# Use mock payment service if in mock mode
-if Config.MOCK_MODE:
-    payment_service = MockPaymentService()
-    print("[MOCK MODE] Using mock payment service for webhooks")
-else:
-    payment_service = PaymentService()
+# Mock or real Instamojo service, chosen once by MOCK_MODE
+payment_service = get_payment_service()
 
 @webhooks_bp.route('/payment/webhook', methods=['POST'])
 def payment_webhook():
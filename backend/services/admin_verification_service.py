@@ -7,11 +7,19 @@ Includes email verification and security checks.
 
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+import logging
+import os
 import secrets
 from utils.supabase_client import supabase
 from services.email_service import get_email_service
 
 
+logger = logging.getLogger(__name__)
+
+# Base URL for verification links, resolved once at import
+_BASE_URL = os.getenv('APP_BASE_URL', 'http://localhost:5173')
+
+
 class AdminVerificationService:
     """Service for handling admin registration and verification"""
     
@@ -190,7 +198,7 @@ class AdminVerificationService:
                 .execute()
             
             # Send approval email with verification link
-            verification_link = f"{AdminVerificationService._get_base_url()}/admin/verify?token={verification_token}"
+            verification_link = f"{_BASE_URL}/admin/verify?token={verification_token}"
             
             email_service = get_email_service()
             email_service.send_email(
@@ -440,12 +448,6 @@ class AdminVerificationService:
                     </html>
                     """
                 )
-        except Exception as e:
+        except Exception:
             # Don't fail the request if notifications fail
-            print(f"Failed to notify admins: {str(e)}")
-    
-    @staticmethod
-    def _get_base_url() -> str:
-        """Get base URL for verification links"""
-        import os
-        return os.getenv('APP_BASE_URL', 'http://localhost:5173')
+            logger.exception("Failed to notify admins")
@@ -7,15 +7,18 @@ Generates PDF certificates with QR codes, digital signatures, and unique IDs.
 
 import os
 import io
-import qrcode
-import hashlib
+import string
+import segno
+import requests
 import secrets
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-from PIL import Image
+from typing import Dict, Any, Optional, List, Iterator
 from supabase import Client
 from .email_service import get_email_service
 from .whatsapp_service import get_whatsapp_service
+from utils.cache import get_cache
 
 # Try to import WeasyPrint, but allow app to start without it
 try:
@@ -30,6 +33,414 @@ except (OSError, ImportError) as e:
     CSS = None
 
 
+# Shared pool for blocking storage / email / WhatsApp round trips
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='certificate-io')
+_IO_MAX_ATTEMPTS = 3
+
+# How long a successful verification lookup is served from memory
+VERIFY_CACHE_TTL_SECONDS = 300
+
+# Keep-alive session for direct storage uploads
+_HTTP_SESSION = requests.Session()
+
+
+def _with_retry(func, *args, **kwargs):
+    """Call func, retrying failures with exponential backoff (1s, 2s, ...)"""
+    for attempt in range(_IO_MAX_ATTEMPTS):
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            if attempt == _IO_MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+
+# Static certificate stylesheet, parsed once at import and shared by every render
+_CERT_CSS_SOURCE = """
+    @page {
+        size: A4 landscape;
+        margin: 0;
+    }
+
+    body {
+        margin: 0;
+        padding: 0;
+        font-family: 'Georgia', serif;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        height: 297mm;
+        width: 210mm;
+        display: flex;
+        justify-content: center;
+        align-items: center;
+    }
+
+    .certificate {
+        background: white;
+        width: 90%;
+        height: 90%;
+        padding: 40px;
+        box-shadow: 0 10px 50px rgba(0,0,0,0.3);
+        position: relative;
+        border: 20px solid #f0f0f0;
+        border-image: linear-gradient(45deg, #667eea, #764ba2) 1;
+    }
+
+    .header {
+        text-align: center;
+        margin-bottom: 30px;
+    }
+
+    .logo {
+        font-size: 36px;
+        font-weight: bold;
+        color: #667eea;
+        margin-bottom: 10px;
+    }
+
+    .title {
+        font-size: 48px;
+        color: #333;
+        margin: 20px 0;
+        font-weight: bold;
+        letter-spacing: 2px;
+    }
+
+    .subtitle {
+        font-size: 18px;
+        color: #666;
+        margin-bottom: 40px;
+    }
+
+    .content {
+        text-align: center;
+        margin: 40px 0;
+    }
+
+    .awarded-to {
+        font-size: 20px;
+        color: #666;
+        margin-bottom: 15px;
+    }
+
+    .student-name {
+        font-size: 42px;
+        color: #333;
+        font-weight: bold;
+        margin: 20px 0;
+        border-bottom: 3px solid #667eea;
+        display: inline-block;
+        padding-bottom: 10px;
+    }
+
+    .completion-text {
+        font-size: 18px;
+        color: #666;
+        margin: 30px 0;
+        line-height: 1.6;
+    }
+
+    .course-name {
+        font-size: 28px;
+        color: #667eea;
+        font-weight: bold;
+        margin: 20px 0;
+    }
+
+    .grade {
+        font-size: 22px;
+        color: #764ba2;
+        margin: 20px 0;
+    }
+
+    .footer {
+        display: flex;
+        justify-content: space-between;
+        align-items: flex-end;
+        margin-top: 60px;
+        padding-top: 30px;
+        border-top: 2px solid #eee;
+    }
+
+    .signature {
+        text-align: center;
+        flex: 1;
+    }
+
+    .signature-line {
+        border-top: 2px solid #333;
+        width: 200px;
+        margin: 0 auto 10px;
+    }
+
+    .signature-name {
+        font-size: 16px;
+        font-weight: bold;
+        color: #333;
+    }
+
+    .signature-title {
+        font-size: 14px;
+        color: #666;
+    }
+
+    .qr-section {
+        text-align: center;
+        flex: 1;
+    }
+
+    .qr-code {
+        width: 100px;
+        height: 100px;
+        margin: 0 auto 10px;
+    }
+
+    .qr-code svg {
+        width: 100%;
+        height: 100%;
+    }
+
+    .certificate-id {
+        font-size: 12px;
+        color: #999;
+        font-family: monospace;
+    }
+
+    .date {
+        font-size: 16px;
+        color: #666;
+        margin-top: 20px;
+    }
+
+    .watermark {
+        position: absolute;
+        top: 50%;
+        left: 50%;
+        transform: translate(-50%, -50%) rotate(-45deg);
+        font-size: 120px;
+        color: rgba(102, 126, 234, 0.05);
+        font-weight: bold;
+        z-index: 0;
+        pointer-events: none;
+    }
+"""
+_CERT_CSS = CSS(string=_CERT_CSS_SOURCE) if WEASYPRINT_AVAILABLE else None
+
+# Bulk documents: body flows as a plain block and each certificate sits in its
+# own A4 landscape page wrapper, which takes over the flex centering
+_CERT_BULK_CSS_SOURCE = """
+    body {
+        display: block;
+        height: auto;
+        width: auto;
+        background: none;
+    }
+
+    .certificate-page {
+        width: 297mm;
+        height: 210mm;
+        overflow: hidden;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        page-break-after: always;
+    }
+
+    .certificate-page:last-child {
+        page-break-after: auto;
+    }
+
+    .certificate-page .certificate {
+        box-sizing: border-box;
+    }
+"""
+_CERT_BULK_CSS = CSS(string=_CERT_BULK_CSS_SOURCE) if WEASYPRINT_AVAILABLE else None
+
+# Per-certificate markup; only the student-specific fields vary between renders
+_CERT_BODY_TMPL = string.Template("""
+    <div class="certificate">
+        <div class="watermark">CERTIFIED</div>
+
+        <div class="header">
+            <div class="logo">🎓 Futura Learning</div>
+            <div class="title">Certificate of Completion</div>
+            <div class="subtitle">This is to certify that</div>
+        </div>
+
+        <div class="content">
+            <div class="student-name">$student_name</div>
+
+            <div class="completion-text">
+                has successfully completed the course
+            </div>
+
+            <div class="course-name">$course_name</div>
+
+            $grade_block
+
+            <div class="date">Issued on $formatted_date</div>
+        </div>
+
+        <div class="footer">
+            <div class="signature">
+                <div class="signature-line"></div>
+                <div class="signature-name">Director</div>
+                <div class="signature-title">Futura Learning</div>
+            </div>
+
+            <div class="qr-section">
+                <div class="qr-code">$qr_svg</div>
+                <div class="certificate-id">ID: $certificate_id</div>
+                <div class="signature-title">Scan to verify</div>
+            </div>
+        </div>
+    </div>
+""")
+
+_CERT_PAGE_TMPL = string.Template('<section class="certificate-page">$body</section>')
+
+_CERT_HTML_TMPL = string.Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+</head>
+<body>
+$body
+</body>
+</html>
+""")
+
+
+_renderer_warm = False
+
+
+def warm_up_renderer() -> None:
+    """
+    Render a throwaway certificate page once per process so the fontconfig,
+    Pango and Cairo setup cost is paid at startup instead of on the first request
+    """
+    global _renderer_warm
+    
+    if _renderer_warm or not WEASYPRINT_AVAILABLE:
+        return
+    
+    try:
+        HTML(string='<div class="certificate">warm-up</div>').write_pdf(
+            target=io.BytesIO(),
+            stylesheets=[_CERT_CSS]
+        )
+        _renderer_warm = True
+    except Exception as e:
+        print(f"[Certificate Service] Renderer warm-up failed: {str(e)}")
+
+
+# Certificate delivery email, filled per recipient
+_CERT_EMAIL_TMPL = string.Template("""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <style>
+            body {
+                font-family: Arial, sans-serif;
+                line-height: 1.6;
+                color: #333;
+                max-width: 600px;
+                margin: 0 auto;
+                padding: 20px;
+            }
+            .header {
+                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                color: white;
+                padding: 30px;
+                text-align: center;
+                border-radius: 10px 10px 0 0;
+            }
+            .header h1 {
+                margin: 0;
+                font-size: 28px;
+            }
+            .content {
+                background: #f9f9f9;
+                padding: 30px;
+                border-radius: 0 0 10px 10px;
+            }
+            .certificate-box {
+                background: white;
+                padding: 20px;
+                border-radius: 8px;
+                margin: 20px 0;
+                border-left: 4px solid #667eea;
+            }
+            .button {
+                display: inline-block;
+                background: #667eea;
+                color: white;
+                padding: 15px 30px;
+                text-decoration: none;
+                border-radius: 5px;
+                margin: 20px 0;
+                font-weight: bold;
+            }
+            .certificate-id {
+                font-family: monospace;
+                background: #f0f0f0;
+                padding: 10px;
+                border-radius: 5px;
+                display: inline-block;
+                margin-top: 10px;
+            }
+            .footer {
+                text-align: center;
+                margin-top: 30px;
+                color: #666;
+                font-size: 14px;
+            }
+        </style>
+    </head>
+    <body>
+        <div class="header">
+            <h1>🎉 Congratulations!</h1>
+            <p>You've earned your certificate</p>
+        </div>
+
+        <div class="content">
+            <p>Dear $student_name,</p>
+
+            <p>Congratulations on successfully completing <strong>$course_name</strong>!</p>
+
+            <div class="certificate-box">
+                <h3>📜 Your Certificate is Ready</h3>
+                <p>We're proud to present you with your certificate of completion. This represents your dedication and hard work throughout the course.</p>
+
+                <a href="$file_url" class="button">Download Certificate</a>
+
+                <p>Certificate ID: <span class="certificate-id">$certificate_id</span></p>
+            </div>
+
+            <h3>What's Next?</h3>
+            <ul>
+                <li>📤 Share your achievement on LinkedIn</li>
+                <li>💼 Add this certification to your resume</li>
+                <li>🔍 Verify your certificate anytime at $base_url/verify/$certificate_id</li>
+                <li>📚 Explore our advanced courses to continue learning</li>
+            </ul>
+
+            <p>Thank you for being part of our learning community!</p>
+
+            <p>Best regards,<br>
+            <strong>The Futura Learning Team</strong></p>
+        </div>
+
+        <div class="footer">
+            <p>© 2025 Futura Learning. All rights reserved.</p>
+            <p>Questions? Contact us at support@futuralearning.com</p>
+        </div>
+    </body>
+    </html>
+""")
+
+
 class CertificateService:
     """Service for generating and managing course completion certificates"""
     
@@ -38,6 +449,7 @@ class CertificateService:
         self.email_service = get_email_service()
         self.whatsapp_service = get_whatsapp_service()
         self.base_url = os.getenv('APP_BASE_URL', 'https://app.example.com')
+        warm_up_renderer()
         
     def generate_certificate(
         self,
@@ -45,7 +457,8 @@ class CertificateService:
         course_name: str,
         completion_date: Optional[str] = None,
         grade: Optional[str] = None,
-        admin_id: Optional[str] = None
+        admin_id: Optional[str] = None,
+        certificate_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate a certificate for a student
@@ -56,6 +469,7 @@ class CertificateService:
             completion_date: Date of completion (defaults to today)
             grade: Grade/score achieved (optional)
             admin_id: UUID of admin generating certificate (optional)
+            certificate_id: Pre-reserved certificate ID (optional, generated if omitted)
             
         Returns:
             Dict with success status, certificate_id, and file_url
@@ -70,14 +484,14 @@ class CertificateService:
             student_name = student.get('full_name') or student.get('email')
             
             # Generate unique certificate ID
-            certificate_id = self._generate_certificate_id(student_id, course_name)
+            certificate_id = certificate_id or self._generate_certificate_id()
             
             # Use today's date if not provided
             if not completion_date:
                 completion_date = datetime.utcnow().strftime('%Y-%m-%d')
             
             # Generate certificate PDF
-            pdf_bytes = self._generate_pdf(
+            pdf_buffer = self._generate_pdf(
                 student_name=student_name,
                 course_name=course_name,
                 completion_date=completion_date,
@@ -86,7 +500,7 @@ class CertificateService:
             )
             
             # Upload to Supabase Storage
-            file_url = self._upload_certificate(certificate_id, pdf_bytes)
+            file_url = self._upload_certificate(certificate_id, pdf_buffer)
             
             # Save certificate record to database
             certificate_data = {
@@ -125,13 +539,259 @@ class CertificateService:
             print(f"[Certificate Service] Error generating certificate: {str(e)}")
             return {'success': False, 'error': str(e)}
     
-    def _generate_certificate_id(self, student_id: str, course_name: str) -> str:
+    def enqueue_certificate(
+        self,
+        student_id: str,
+        course_name: str,
+        completion_date: Optional[str] = None,
+        grade: Optional[str] = None,
+        admin_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue a certificate for generation on the background scheduler
+        
+        Rendering, upload and delivery run off the request thread; poll
+        get_certificate_job with the returned certificate_id for progress.
+        
+        Args:
+            student_id: UUID of the student
+            course_name: Name of the course
+            completion_date: Date of completion (defaults to today)
+            grade: Grade/score achieved (optional)
+            admin_id: UUID of admin generating certificate (optional)
+            
+        Returns:
+            Dict with success status, pending status and reserved certificate_id
+        """
+        certificate_id = None
+        job_recorded = False
+        try:
+            from jobs.scheduler import get_scheduler
+            
+            certificate_id = self._generate_certificate_id()
+            
+            self.supabase.table('certificate_jobs').insert({
+                'certificate_id': certificate_id,
+                'student_id': student_id,
+                'course_name': course_name,
+                'status': 'pending',
+                'requested_by': admin_id
+            }).execute()
+            job_recorded = True
+            
+            get_scheduler().enqueue(
+                self._run_certificate_job,
+                job_id=f"certificate_{certificate_id}",
+                name=f"Generate certificate {certificate_id}",
+                student_id=student_id,
+                course_name=course_name,
+                completion_date=completion_date,
+                grade=grade,
+                admin_id=admin_id,
+                certificate_id=certificate_id
+            )
+            
+            return {'success': True, 'status': 'pending', 'certificate_id': certificate_id}
+            
+        except Exception as e:
+            print(f"[Certificate Service] Error queueing certificate: {str(e)}")
+            # The job row exists but nothing will run it; don't leave it pending
+            if job_recorded:
+                self._finish_certificate_job(certificate_id, {'status': 'failed', 'error': str(e)})
+            return {'success': False, 'error': str(e), 'certificate_id': certificate_id if job_recorded else None}
+    
+    def _run_certificate_job(self, certificate_id: str, **kwargs) -> None:
+        """Background job body: generate the certificate and record the outcome"""
+        update = {'status': 'failed', 'error': 'Certificate job did not finish'}
+        try:
+            self.supabase.table('certificate_jobs').update(
+                {'status': 'processing'}
+            ).eq('certificate_id', certificate_id).execute()
+            
+            result = self.generate_certificate(certificate_id=certificate_id, **kwargs)
+            
+            if result['success']:
+                update = {'status': 'completed', 'file_url': result['file_url']}
+            else:
+                update = {'status': 'failed', 'error': result.get('error')}
+                
+        except Exception as e:
+            print(f"[Certificate Service] Certificate job {certificate_id} failed: {str(e)}")
+            update = {'status': 'failed', 'error': str(e)}
+            
+        finally:
+            # Always leave the job in a terminal state
+            self._finish_certificate_job(certificate_id, update)
+    
+    def _finish_certificate_job(self, certificate_id: str, update: Dict[str, Any]) -> None:
+        """Write a job's terminal status, retrying transient failures"""
+        try:
+            _with_retry(
+                lambda: self.supabase.table('certificate_jobs').update(update).eq('certificate_id', certificate_id).execute()
+            )
+        except Exception as e:
+            print(f"[Certificate Service] Error recording certificate job {certificate_id}: {str(e)}")
+    
+    def get_certificate_job(self, certificate_id: str) -> Optional[Dict[str, Any]]:
+        """Get the status of a queued certificate"""
+        try:
+            response = self.supabase.table('certificate_jobs').select(
+                'certificate_id, student_id, course_name, status, file_url, error, created_at, updated_at'
+            ).eq('certificate_id', certificate_id).execute()
+            
+            return response.data[0] if response.data else None
+            
+        except Exception as e:
+            print(f"[Certificate Service] Error fetching certificate job: {str(e)}")
+            return None
+    
+    def generate_certificates_bulk(
+        self,
+        entries: List[Dict[str, Any]],
+        admin_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate certificates for several students at once
+        
+        All certificates share one template, so they are laid out in a single
+        multi-page render and split into per-student PDFs afterwards.
+        
+        Args:
+            entries: List of dicts with student_id, course_name and optional
+                completion_date / grade
+            admin_id: UUID of admin generating certificates (optional)
+            
+        Returns:
+            Dict with success status and per-entry results in input order
+        """
+        try:
+            results: List[Optional[Dict[str, Any]]] = [None] * len(entries)
+            if not entries:
+                return {'success': True, 'generated': 0, 'failed': 0, 'results': []}
+            
+            # Fetch all students in one round trip
+            student_ids = list({entry.get('student_id') for entry in entries if entry.get('student_id')})
+            student_response = self.supabase.table('profiles').select('*').in_('id', student_ids).execute()
+            students = {student['id']: student for student in (student_response.data or [])}
+            
+            today = datetime.utcnow().strftime('%Y-%m-%d')
+            prepared = []
+            for index, entry in enumerate(entries):
+                student = students.get(entry.get('student_id'))
+                if not student or not entry.get('course_name'):
+                    results[index] = {
+                        'success': False,
+                        'student_id': entry.get('student_id'),
+                        'error': 'Student not found' if entry.get('course_name') else 'course_name is required'
+                    }
+                    continue
+                
+                student_name = student.get('full_name') or student.get('email')
+                course_name = entry['course_name']
+                prepared.append({
+                    'index': index,
+                    'student': student,
+                    'pdf_args': {
+                        'student_name': student_name,
+                        'course_name': course_name,
+                        'completion_date': entry.get('completion_date') or today,
+                        'certificate_id': self._generate_certificate_id(),
+                        'grade': entry.get('grade')
+                    }
+                })
+            
+            if prepared:
+                # Render every certificate in one pass and hand each PDF to the
+                # I/O pool as soon as it is serialized, so uploads of earlier
+                # certificates overlap with producing the later ones
+                upload_futures = [
+                    _IO_POOL.submit(self._upload_certificate, item['pdf_args']['certificate_id'], pdf_buffer)
+                    for item, pdf_buffer in zip(
+                        prepared,
+                        self._iter_pdfs_bulk([item['pdf_args'] for item in prepared])
+                    )
+                ]
+                file_urls = [future.result() for future in upload_futures]
+                
+                records = []
+                for item, file_url in zip(prepared, file_urls):
+                    args = item['pdf_args']
+                    item['file_url'] = file_url
+                    records.append({
+                        'student_id': item['student']['id'],
+                        'certificate_id': args['certificate_id'],
+                        'course_name': args['course_name'],
+                        'issued_at': args['completion_date'],
+                        'grade': args['grade'],
+                        'file_url': item['file_url'],
+                        'issued_by': admin_id
+                    })
+                
+                # Save all certificate records in a single insert
+                cert_response = self.supabase.table('certificates').insert(records).execute()
+                saved_ids = {row['certificate_id'] for row in (cert_response.data or [])}
+                
+                # Send certificates to students: one batched email request for
+                # everyone, WhatsApp messages in flight alongside it
+                deliveries = []
+                for item in prepared:
+                    args = item['pdf_args']
+                    student = item['student']
+                    if args['certificate_id'] not in saved_ids:
+                        results[item['index']] = {
+                            'success': False,
+                            'student_id': student['id'],
+                            'error': 'Failed to save certificate record'
+                        }
+                        continue
+                    
+                    deliveries.append((item, self._submit_delivery(
+                        student_email=student.get('email'),
+                        student_phone=student.get('phone'),
+                        student_name=args['student_name'],
+                        course_name=args['course_name'],
+                        file_url=item['file_url'],
+                        certificate_id=args['certificate_id'],
+                        include_email=False
+                    )))
+                
+                email_items = [item for item, _ in deliveries if item['student'].get('email')]
+                email_future = (
+                    _IO_POOL.submit(self._send_certificate_emails_batch, email_items)
+                    if email_items else None
+                )
+                
+                for item, futures in deliveries:
+                    results[item['index']] = {
+                        'success': True,
+                        'student_id': item['student']['id'],
+                        'certificate_id': item['pdf_args']['certificate_id'],
+                        'file_url': item['file_url'],
+                        'delivery': self._collect_delivery(futures)
+                    }
+                
+                # Each student only gets their own entry from the batch response
+                if email_future is not None:
+                    for item, outcome in zip(email_items, email_future.result()):
+                        results[item['index']]['delivery']['email'] = outcome
+            
+            generated = sum(1 for result in results if result['success'])
+            return {
+                'success': True,
+                'generated': generated,
+                'failed': len(results) - generated,
+                'results': results
+            }
+            
+        except Exception as e:
+            print(f"[Certificate Service] Error generating certificates in bulk: {str(e)}")
+            return {'success': False, 'error': str(e)}
+    
+    def _generate_certificate_id(self) -> str:
         """Generate unique certificate ID"""
-        # Format: CERT-YYYYMMDD-HASH
+        # Format: CERT-YYYYMMDD-RANDOM (32 random bits, no hashing needed)
         date_str = datetime.utcnow().strftime('%Y%m%d')
-        hash_input = f"{student_id}_{course_name}_{datetime.utcnow().isoformat()}_{secrets.token_hex(8)}"
-        hash_value = hashlib.sha256(hash_input.encode()).hexdigest()[:8].upper()
-        return f"CERT-{date_str}-{hash_value}"
+        return f"CERT-{date_str}-{secrets.token_hex(4).upper()}"
     
     def _generate_pdf(
         self,
@@ -140,8 +800,8 @@ class CertificateService:
         completion_date: str,
         certificate_id: str,
         grade: Optional[str] = None
-    ) -> bytes:
-        """Generate PDF certificate from HTML template"""
+    ) -> io.BytesIO:
+        """Generate PDF certificate from HTML template into an in-memory buffer"""
         
         # Check if WeasyPrint is available
         if not WEASYPRINT_AVAILABLE:
@@ -150,8 +810,34 @@ class CertificateService:
                 "To enable, install GTK+ libraries: https://doc.courtbouillon.org/weasyprint/stable/first_steps.html#windows"
             )
         
-        # Generate QR code for verification
-        qr_data_url = self._generate_qr_code(certificate_id)
+        html_content = _CERT_HTML_TMPL.substitute(
+            body=self._build_certificate_body(
+                student_name=student_name,
+                course_name=course_name,
+                completion_date=completion_date,
+                certificate_id=certificate_id,
+                grade=grade
+            )
+        )
+        
+        # Generate PDF straight into a buffer that is uploaded without copying
+        buffer = io.BytesIO()
+        HTML(string=html_content).write_pdf(target=buffer, stylesheets=[_CERT_CSS])
+        return buffer
+    
+    def _build_certificate_body(
+        self,
+        student_name: str,
+        course_name: str,
+        completion_date: str,
+        certificate_id: str,
+        grade: Optional[str] = None,
+        qr_svg: Optional[str] = None
+    ) -> str:
+        """Fill the certificate markup for a single student"""
+        # Generate QR code for verification unless it was prebuilt
+        if qr_svg is None:
+            qr_svg = self._generate_qr_code(certificate_id)
         
         # Format completion date
         try:
@@ -160,259 +846,75 @@ class CertificateService:
         except:
             formatted_date = completion_date
         
-        # Build HTML content
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                @page {{
-                    size: A4 landscape;
-                    margin: 0;
-                }}
-                
-                body {{
-                    margin: 0;
-                    padding: 0;
-                    font-family: 'Georgia', serif;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    height: 297mm;
-                    width: 210mm;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                }}
-                
-                .certificate {{
-                    background: white;
-                    width: 90%;
-                    height: 90%;
-                    padding: 40px;
-                    box-shadow: 0 10px 50px rgba(0,0,0,0.3);
-                    position: relative;
-                    border: 20px solid #f0f0f0;
-                    border-image: linear-gradient(45deg, #667eea, #764ba2) 1;
-                }}
-                
-                .header {{
-                    text-align: center;
-                    margin-bottom: 30px;
-                }}
-                
-                .logo {{
-                    font-size: 36px;
-                    font-weight: bold;
-                    color: #667eea;
-                    margin-bottom: 10px;
-                }}
-                
-                .title {{
-                    font-size: 48px;
-                    color: #333;
-                    margin: 20px 0;
-                    font-weight: bold;
-                    letter-spacing: 2px;
-                }}
-                
-                .subtitle {{
-                    font-size: 18px;
-                    color: #666;
-                    margin-bottom: 40px;
-                }}
-                
-                .content {{
-                    text-align: center;
-                    margin: 40px 0;
-                }}
-                
-                .awarded-to {{
-                    font-size: 20px;
-                    color: #666;
-                    margin-bottom: 15px;
-                }}
-                
-                .student-name {{
-                    font-size: 42px;
-                    color: #333;
-                    font-weight: bold;
-                    margin: 20px 0;
-                    border-bottom: 3px solid #667eea;
-                    display: inline-block;
-                    padding-bottom: 10px;
-                }}
-                
-                .completion-text {{
-                    font-size: 18px;
-                    color: #666;
-                    margin: 30px 0;
-                    line-height: 1.6;
-                }}
-                
-                .course-name {{
-                    font-size: 28px;
-                    color: #667eea;
-                    font-weight: bold;
-                    margin: 20px 0;
-                }}
-                
-                .grade {{
-                    font-size: 22px;
-                    color: #764ba2;
-                    margin: 20px 0;
-                }}
-                
-                .footer {{
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: flex-end;
-                    margin-top: 60px;
-                    padding-top: 30px;
-                    border-top: 2px solid #eee;
-                }}
-                
-                .signature {{
-                    text-align: center;
-                    flex: 1;
-                }}
-                
-                .signature-line {{
-                    border-top: 2px solid #333;
-                    width: 200px;
-                    margin: 0 auto 10px;
-                }}
-                
-                .signature-name {{
-                    font-size: 16px;
-                    font-weight: bold;
-                    color: #333;
-                }}
-                
-                .signature-title {{
-                    font-size: 14px;
-                    color: #666;
-                }}
-                
-                .qr-section {{
-                    text-align: center;
-                    flex: 1;
-                }}
-                
-                .qr-code {{
-                    width: 100px;
-                    height: 100px;
-                    margin-bottom: 10px;
-                }}
-                
-                .certificate-id {{
-                    font-size: 12px;
-                    color: #999;
-                    font-family: monospace;
-                }}
-                
-                .date {{
-                    font-size: 16px;
-                    color: #666;
-                    margin-top: 20px;
-                }}
-                
-                .watermark {{
-                    position: absolute;
-                    top: 50%;
-                    left: 50%;
-                    transform: translate(-50%, -50%) rotate(-45deg);
-                    font-size: 120px;
-                    color: rgba(102, 126, 234, 0.05);
-                    font-weight: bold;
-                    z-index: 0;
-                    pointer-events: none;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="certificate">
-                <div class="watermark">CERTIFIED</div>
-                
-                <div class="header">
-                    <div class="logo">🎓 Futura Learning</div>
-                    <div class="title">Certificate of Completion</div>
-                    <div class="subtitle">This is to certify that</div>
-                </div>
-                
-                <div class="content">
-                    <div class="student-name">{student_name}</div>
-                    
-                    <div class="completion-text">
-                        has successfully completed the course
-                    </div>
-                    
-                    <div class="course-name">{course_name}</div>
-                    
-                    {"<div class='grade'>Grade: " + grade + "</div>" if grade else ""}
-                    
-                    <div class="date">Issued on {formatted_date}</div>
-                </div>
-                
-                <div class="footer">
-                    <div class="signature">
-                        <div class="signature-line"></div>
-                        <div class="signature-name">Director</div>
-                        <div class="signature-title">Futura Learning</div>
-                    </div>
-                    
-                    <div class="qr-section">
-                        <img src="{qr_data_url}" alt="QR Code" class="qr-code">
-                        <div class="certificate-id">ID: {certificate_id}</div>
-                        <div class="signature-title">Scan to verify</div>
-                    </div>
-                </div>
-            </div>
-        </body>
-        </html>
+        return _CERT_BODY_TMPL.substitute(
+            student_name=student_name,
+            course_name=course_name,
+            grade_block=f"<div class='grade'>Grade: {grade}</div>" if grade else "",
+            formatted_date=formatted_date,
+            qr_svg=qr_svg,
+            certificate_id=certificate_id
+        )
+    
+    def _iter_pdfs_bulk(self, certificates: List[Dict[str, Any]]) -> Iterator[io.BytesIO]:
         """
+        Render several certificates in a single WeasyPrint layout pass
         
-        # Generate PDF
-        pdf = HTML(string=html_content).write_pdf()
-        return pdf
-    
-    def _generate_qr_code(self, certificate_id: str) -> str:
-        """Generate QR code for certificate verification"""
-        # Verification URL
-        verify_url = f"{self.base_url}/verify/{certificate_id}"
+        PDFs are yielded one at a time so callers can start uploading a
+        certificate while the next one is still being serialized.
+        
+        Args:
+            certificates: List of keyword-argument dicts for _generate_pdf
+            
+        Yields:
+            PDF buffers, one per certificate, in input order
+        """
+        if not WEASYPRINT_AVAILABLE:
+            raise RuntimeError(
+                "WeasyPrint is not available. PDF generation is disabled. "
+                "To enable, install GTK+ libraries: https://doc.courtbouillon.org/weasyprint/stable/first_steps.html#windows"
+            )
         
-        # Generate QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=2,
+        # Build every QR code on the I/O pool while the bodies are assembled
+        qr_futures = [
+            _IO_POOL.submit(self._generate_qr_code, cert['certificate_id'])
+            for cert in certificates
+        ]
+        html_content = _CERT_HTML_TMPL.substitute(
+            body=''.join(
+                _CERT_PAGE_TMPL.substitute(
+                    body=self._build_certificate_body(**cert, qr_svg=qr_future.result())
+                )
+                for cert, qr_future in zip(certificates, qr_futures)
+            )
         )
-        qr.add_data(verify_url)
-        qr.make(fit=True)
+        document = HTML(string=html_content).render(stylesheets=[_CERT_CSS, _CERT_BULK_CSS])
         
-        # Create image
-        img = qr.make_image(fill_color="black", back_color="white")
+        # Each certificate must land on exactly one page to be split apart
+        if len(document.pages) != len(certificates):
+            for cert in certificates:
+                yield self._generate_pdf(**cert)
+            return
         
-        # Convert to data URL
-        buffer = io.BytesIO()
-        img.save(buffer, format='PNG')
-        buffer.seek(0)
+        for page in document.pages:
+            buffer = io.BytesIO()
+            document.copy([page]).write_pdf(target=buffer)
+            yield buffer
+    
+    def _generate_qr_code(self, certificate_id: str) -> str:
+        """Generate QR code for certificate verification as inline SVG markup"""
+        # Verification URL
+        verify_url = f"{self.base_url}/verify/{certificate_id}"
         
-        import base64
-        img_data = base64.b64encode(buffer.read()).decode()
-        return f"data:image/png;base64,{img_data}"
+        # Inline SVG is drawn natively by WeasyPrint, no raster encode/decode
+        return segno.make(verify_url, error='L').svg_inline(scale=10, border=2)
     
-    def _upload_certificate(self, certificate_id: str, pdf_bytes: bytes) -> str:
+    def _upload_certificate(self, certificate_id: str, pdf_buffer: io.BytesIO) -> str:
         """Upload certificate PDF to Supabase Storage"""
         try:
             # Upload to certificates bucket
             file_path = f"certificates/{certificate_id}.pdf"
             
-            self.supabase.storage.from_('certificates').upload(
-                path=file_path,
-                file=pdf_bytes,
-                file_options={"content-type": "application/pdf"}
-            )
+            _with_retry(self._put_to_storage, file_path, pdf_buffer)
             
             # Get public URL
             file_url = self.supabase.storage.from_('certificates').get_public_url(file_path)
@@ -424,9 +926,32 @@ class CertificateService:
             local_path = f"/tmp/certificates/{certificate_id}.pdf"
             os.makedirs(os.path.dirname(local_path), exist_ok=True)
             with open(local_path, 'wb') as f:
-                f.write(pdf_bytes)
+                f.write(pdf_buffer.getbuffer())
             return f"file://{local_path}"
     
+    def _put_to_storage(self, file_path: str, pdf_buffer: io.BytesIO) -> None:
+        """
+        PUT the PDF straight to a signed upload URL, bypassing the SDK upload path
+        
+        Uploads upsert, so a retry after a PUT whose response was lost
+        overwrites the stored object instead of failing with "already exists".
+        """
+        bucket = self.supabase.storage.from_('certificates')
+        try:
+            signed = bucket.create_signed_upload_url(file_path, {'upsert': 'true'})
+        except TypeError:
+            # Older storage clients take no options; x-upsert on the PUT covers them
+            signed = bucket.create_signed_upload_url(file_path)
+        signed_url = signed.get('signed_url') or signed.get('signedUrl')
+        
+        response = _HTTP_SESSION.put(
+            signed_url,
+            data=pdf_buffer.getbuffer(),
+            headers={'Content-Type': 'application/pdf', 'x-upsert': 'true'},
+            timeout=30
+        )
+        response.raise_for_status()
+    
     def _deliver_certificate(
         self,
         student_email: str,
@@ -437,9 +962,57 @@ class CertificateService:
         certificate_id: str
     ) -> Dict[str, Any]:
         """Deliver certificate via email and WhatsApp"""
-        results = {}
+        return self._collect_delivery(self._submit_delivery(
+            student_email=student_email,
+            student_phone=student_phone,
+            student_name=student_name,
+            course_name=course_name,
+            file_url=file_url,
+            certificate_id=certificate_id
+        ))
+    
+    def _submit_delivery(
+        self,
+        student_email: str,
+        student_phone: Optional[str],
+        student_name: str,
+        course_name: str,
+        file_url: str,
+        certificate_id: str,
+        include_email: bool = True
+    ) -> Dict[str, Future]:
+        """Submit email and WhatsApp deliveries to the I/O pool so they run concurrently"""
+        futures = {}
+        
+        if include_email:
+            futures['email'] = _IO_POOL.submit(
+                self._send_certificate_email,
+                student_email, student_name, course_name, file_url, certificate_id
+            )
         
-        # Send email
+        if student_phone:
+            futures['whatsapp'] = _IO_POOL.submit(
+                self._send_certificate_whatsapp,
+                student_phone, student_name, course_name, file_url, certificate_id
+            )
+        
+        return futures
+    
+    @staticmethod
+    def _collect_delivery(futures: Dict[str, Future]) -> Dict[str, Any]:
+        """Wait for submitted deliveries and gather their results by channel"""
+        wait(futures.values())
+        return {channel: future.result() for channel, future in futures.items()}
+    
+    def _send_certificate_email(
+        self,
+        student_email: str,
+        student_name: str,
+        course_name: str,
+        file_url: str,
+        certificate_id: str
+    ) -> Any:
+        """Send the certificate delivery email"""
         try:
             email_html = self._format_certificate_email(
                 student_name=student_name,
@@ -448,38 +1021,85 @@ class CertificateService:
                 certificate_id=certificate_id
             )
             
-            email_result = self.email_service.send_email(
+            return self.email_service.send_email(
                 to_email=student_email,
                 subject=f"🎉 Your Certificate: {course_name}",
                 html_content=email_html
             )
-            results['email'] = email_result
             
         except Exception as e:
             print(f"[Certificate Service] Email delivery error: {str(e)}")
-            results['email'] = {'success': False, 'error': str(e)}
-        
-        # Send WhatsApp notification
-        if student_phone:
-            try:
-                whatsapp_message = (
-                    f"🎉 Congratulations {student_name}!\n\n"
-                    f"You've successfully completed: {course_name}\n\n"
-                    f"📜 Download your certificate:\n{file_url}\n\n"
-                    f"Certificate ID: {certificate_id}"
-                )
-                
-                whatsapp_result = self.whatsapp_service.send_message(
-                    phone=student_phone,
-                    message=whatsapp_message
-                )
-                results['whatsapp'] = whatsapp_result
-                
-            except Exception as e:
-                print(f"[Certificate Service] WhatsApp delivery error: {str(e)}")
-                results['whatsapp'] = {'success': False, 'error': str(e)}
+            return {'success': False, 'error': str(e)}
+    
+    def _send_certificate_emails_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send certificate emails for a bulk issuance in one batched request
         
-        return results
+        Returns:
+            One delivery outcome per item, in input order
+        """
+        try:
+            # Shared body with per-recipient substitution tokens
+            email_html = self._format_certificate_email(
+                student_name='-student_name-',
+                course_name='-course_name-',
+                file_url='-file_url-',
+                certificate_id='-certificate_id-'
+            )
+            
+            response = self.email_service.send_batch_emails([
+                {
+                    'to_email': item['student']['email'],
+                    'subject': f"🎉 Your Certificate: {item['pdf_args']['course_name']}",
+                    'content': email_html,
+                    'substitutions': {
+                        '-student_name-': item['pdf_args']['student_name'],
+                        '-course_name-': item['pdf_args']['course_name'],
+                        '-file_url-': item['file_url'],
+                        '-certificate_id-': item['pdf_args']['certificate_id']
+                    }
+                }
+                for item in items
+            ])
+            
+            recipient_results = response.get('results') or []
+            if len(recipient_results) != len(items):
+                raise RuntimeError(response.get('error') or 'Batch response missing per-recipient results')
+            
+            return [
+                {**result, 'success': result.get('status') != 'rejected'}
+                for result in recipient_results
+            ]
+            
+        except Exception as e:
+            print(f"[Certificate Service] Batch email delivery error: {str(e)}")
+            return [{'success': False, 'error': str(e)} for _ in items]
+    
+    def _send_certificate_whatsapp(
+        self,
+        student_phone: str,
+        student_name: str,
+        course_name: str,
+        file_url: str,
+        certificate_id: str
+    ) -> Any:
+        """Send the certificate WhatsApp notification"""
+        try:
+            whatsapp_message = (
+                f"🎉 Congratulations {student_name}!\n\n"
+                f"You've successfully completed: {course_name}\n\n"
+                f"📜 Download your certificate:\n{file_url}\n\n"
+                f"Certificate ID: {certificate_id}"
+            )
+            
+            return self.whatsapp_service.send_message(
+                phone=student_phone,
+                message=whatsapp_message
+            )
+            
+        except Exception as e:
+            print(f"[Certificate Service] WhatsApp delivery error: {str(e)}")
+            return {'success': False, 'error': str(e)}
     
     def _format_certificate_email(
         self,
@@ -489,110 +1109,13 @@ class CertificateService:
         certificate_id: str
     ) -> str:
         """Format certificate delivery email"""
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 600px;
-                    margin: 0 auto;
-                    padding: 20px;
-                }}
-                .header {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 30px;
-                    text-align: center;
-                    border-radius: 10px 10px 0 0;
-                }}
-                .header h1 {{
-                    margin: 0;
-                    font-size: 28px;
-                }}
-                .content {{
-                    background: #f9f9f9;
-                    padding: 30px;
-                    border-radius: 0 0 10px 10px;
-                }}
-                .certificate-box {{
-                    background: white;
-                    padding: 20px;
-                    border-radius: 8px;
-                    margin: 20px 0;
-                    border-left: 4px solid #667eea;
-                }}
-                .button {{
-                    display: inline-block;
-                    background: #667eea;
-                    color: white;
-                    padding: 15px 30px;
-                    text-decoration: none;
-                    border-radius: 5px;
-                    margin: 20px 0;
-                    font-weight: bold;
-                }}
-                .certificate-id {{
-                    font-family: monospace;
-                    background: #f0f0f0;
-                    padding: 10px;
-                    border-radius: 5px;
-                    display: inline-block;
-                    margin-top: 10px;
-                }}
-                .footer {{
-                    text-align: center;
-                    margin-top: 30px;
-                    color: #666;
-                    font-size: 14px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>🎉 Congratulations!</h1>
-                <p>You've earned your certificate</p>
-            </div>
-            
-            <div class="content">
-                <p>Dear {student_name},</p>
-                
-                <p>Congratulations on successfully completing <strong>{course_name}</strong>!</p>
-                
-                <div class="certificate-box">
-                    <h3>📜 Your Certificate is Ready</h3>
-                    <p>We're proud to present you with your certificate of completion. This represents your dedication and hard work throughout the course.</p>
-                    
-                    <a href="{file_url}" class="button">Download Certificate</a>
-                    
-                    <p>Certificate ID: <span class="certificate-id">{certificate_id}</span></p>
-                </div>
-                
-                <h3>What's Next?</h3>
-                <ul>
-                    <li>📤 Share your achievement on LinkedIn</li>
-                    <li>💼 Add this certification to your resume</li>
-                    <li>🔍 Verify your certificate anytime at {self.base_url}/verify/{certificate_id}</li>
-                    <li>📚 Explore our advanced courses to continue learning</li>
-                </ul>
-                
-                <p>Thank you for being part of our learning community!</p>
-                
-                <p>Best regards,<br>
-                <strong>The Futura Learning Team</strong></p>
-            </div>
-            
-            <div class="footer">
-                <p>© 2025 Futura Learning. All rights reserved.</p>
-                <p>Questions? Contact us at support@futuralearning.com</p>
-            </div>
-        </body>
-        </html>
-        """
+        return _CERT_EMAIL_TMPL.substitute(
+            student_name=student_name,
+            course_name=course_name,
+            file_url=file_url,
+            certificate_id=certificate_id,
+            base_url=self.base_url
+        )
     
     def verify_certificate(self, certificate_id: str) -> Dict[str, Any]:
         """
@@ -604,6 +1127,11 @@ class CertificateService:
         Returns:
             Dict with verification status and certificate details
         """
+        cache_key = f"certificate:{certificate_id}"
+        cached_result = get_cache().get(cache_key)
+        if cached_result is not None:
+            return cached_result
+        
         try:
             response = self.supabase.table('certificates').select(
                 'id, certificate_id, student_id, course_name, issued_at, grade, profiles(full_name, email)'
@@ -618,7 +1146,7 @@ class CertificateService:
             cert = response.data[0]
             student = cert.get('profiles', {})
             
-            return {
+            result = {
                 'valid': True,
                 'certificate': {
                     'id': cert['certificate_id'],
@@ -629,6 +1157,10 @@ class CertificateService:
                 }
             }
             
+            # Certificates are scanned repeatedly; keep successful lookups warm
+            get_cache().set(cache_key, result, VERIFY_CACHE_TTL_SECONDS)
+            return result
+            
         except Exception as e:
             print(f"[Certificate Service] Verification error: {str(e)}")
             return {'valid': False, 'error': str(e)}
@@ -656,6 +1188,8 @@ class CertificateService:
                 'revoke_reason': reason
             }).eq('certificate_id', certificate_id).execute()
             
+            get_cache().delete(f"certificate:{certificate_id}")
+            
             if response.data:
                 return {'success': True, 'message': 'Certificate revoked'}
             return {'success': False, 'error': 'Certificate not found'}
@@ -1,11 +1,30 @@
+import gzip
+import orjson
 import requests
 from config import Config
 
+# Shared session so SendGrid connections are kept alive between sends
+_SESSION = requests.Session()
+
+# SendGrid limit on recipients (personalizations) per request
+MAX_PERSONALIZATIONS = 1000
+
+# Request bodies larger than this are gzip-compressed before sending
+GZIP_MIN_BYTES = 2048
+
 class EmailService:
     def __init__(self):
         self.api_key = Config.SENDGRID_API_KEY
         self.base_url = "https://api.sendgrid.com/v3/mail/send"
     
+    def _post(self, headers, data):
+        """POST a JSON payload to SendGrid, gzip-compressing large bodies"""
+        body = orjson.dumps(data)
+        if len(body) > GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**headers, "Content-Encoding": "gzip"}
+        return _SESSION.post(self.base_url, headers=headers, data=body, timeout=10)
+    
     def send_email(self, to_email, subject, content):
         if not self.api_key:
             print("SendGrid API Key missing")
@@ -24,11 +43,97 @@ class EmailService:
         }
         
         try:
-            response = requests.post(self.base_url, headers=headers, json=data)
+            response = self._post(headers, data)
             return response.status_code in [200, 201, 202]
         except Exception as e:
             print(f"Error sending email: {e}")
             return False
+    
+    def send_batch_emails(self, emails):
+        """
+        Send many emails with as few SendGrid requests as possible.
+        
+        Emails sharing the same content are packed into one request, one
+        personalization per recipient (SendGrid allows up to 1000). Per-recipient
+        values go in each email's optional 'substitutions' dict, whose keys are
+        replaced inside the shared content by SendGrid.
+        
+        Args:
+            emails: List of dicts with to_email, subject, content and optional
+                substitutions
+        
+        Returns:
+            Dict with success flag, accepted/rejected counts and per-recipient
+            results in input order
+        """
+        if not self.api_key:
+            print("SendGrid API Key missing")
+            return {
+                "success": False,
+                "accepted": 0,
+                "rejected": len(emails),
+                "total": len(emails),
+                "results": [
+                    {"to": email['to_email'], "status": "rejected", "error": "SendGrid API Key missing"}
+                    for email in emails
+                ]
+            }
+        
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # Group recipients that share a body so each group is a single POST
+        groups = {}
+        for email in emails:
+            groups.setdefault(email['content'], []).append(email)
+        
+        # Recipients start rejected and are flipped once their chunk is accepted
+        results = [
+            {"to": email['to_email'], "status": "rejected", "error": "Request failed"}
+            for email in emails
+        ]
+        positions = {id(email): index for index, email in enumerate(emails)}
+        
+        accepted = 0
+        for content, recipients in groups.items():
+            for start in range(0, len(recipients), MAX_PERSONALIZATIONS):
+                chunk = recipients[start:start + MAX_PERSONALIZATIONS]
+                data = {
+                    "personalizations": [
+                        {
+                            "to": [{"email": email['to_email']}],
+                            "subject": email['subject'],
+                            "substitutions": email.get('substitutions') or {}
+                        }
+                        for email in chunk
+                    ],
+                    "from": {"email": "noreply@yourdomain.com"},
+                    "content": [{"type": "text/html", "value": content}]
+                }
+                
+                try:
+                    response = self._post(headers, data)
+                    if response.status_code in [200, 201, 202]:
+                        accepted += len(chunk)
+                        for email in chunk:
+                            results[positions[id(email)]] = {"to": email['to_email'], "status": "queued"}
+                    else:
+                        for email in chunk:
+                            results[positions[id(email)]]['error'] = f"SendGrid returned {response.status_code}"
+                except Exception as e:
+                    print(f"Error sending batch email: {e}")
+                    for email in chunk:
+                        results[positions[id(email)]]['error'] = str(e)
+        
+        return {
+            "success": accepted == len(emails),
+            "accepted": accepted,
+            "rejected": len(emails) - accepted,
+            "total": len(emails),
+            "results": results
+        }
 
 
 # Global singleton instance
@@ -1,40 +1,130 @@
+import os
 import time
+import logging
 import random
-import uuid
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from utils.supabase_client import supabase
+from utils.supabase_client import get_supabase_client
+from utils.cache import get_cache
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+# Worker pool so batch log inserts for separate chunks overlap
+_EXECUTOR = ThreadPoolExecutor(max_workers=Config.MOCK_BATCH_WORKERS, thread_name_prefix='mock-email')
+
+# Rows per email_logs insert request, keeps payloads under Supabase limits
+LOG_BATCH_SIZE = 500
+
+# get_email_stats result is served from cache until a new log row lands.
+# The cache is per process, so other workers only see new rows once their
+# copy expires; keep that window short
+STATS_CACHE_KEY = 'mock_email:stats'
+STATS_CACHE_TTL_SECONDS = 30
+
+# Polled message statuses are served from cache for this long
+STATUS_CACHE_TTL_SECONDS = 30
+
+DEFAULT_FROM_EMAIL = 'noreply@futurefounders.com'
+SERVICE_NAME = 'mock_sendgrid'
+
+# Random bytes per message ID (hex-encoded to 16 characters)
+MESSAGE_ID_BYTES = 8
+
+# Event history for each simulated status (queued → sent → delivered)
+_QUEUED_EVENT = {"event": "queued", "reason": "Message queued for delivery"}
+_SENT_EVENT = {"event": "sent"}
+_DELIVERED_EVENT = {"event": "delivered"}
+_STATUS_EVENTS = {
+    'queued': (_QUEUED_EVENT,),
+    'sent': (_QUEUED_EVENT, _SENT_EVENT),
+    'delivered': (_QUEUED_EVENT, _SENT_EVENT, _DELIVERED_EVENT),
+}
+_STATUSES = tuple(_STATUS_EVENTS)
+
 class MockEmailService:
     """
     Enhanced mock email service that mimics SendGrid API responses exactly.
     All operations are logged to database for tracking and debugging.
+    
+    Mock mode is read once at import time; toggling MOCK_MODE requires a
+    process restart.
     """
     def __init__(self):
         self.mock_mode = Config.MOCK_MODE
-        self.supabase = supabase
+        self.supabase = get_supabase_client()
     
     def _log_to_supabase(self, table_name, data):
         """Log mock service actions to Supabase for visibility"""
         try:
             response = self.supabase.table(table_name).insert(data).execute()
+            self.invalidate_stats_cache()
             return response.data[0] if response.data else None
         except Exception as e:
-            print(f"Error logging to Supabase: {e}")
+            logger.error("Error logging to Supabase: %s", e)
             return None
     
+    def _build_log_row(self, to_email, subject, content, from_email, template_name, template_params, message_id, failed, now_iso=None):
+        """Build an email_logs row with SendGrid-compatible structure"""
+        status = 'failed' if failed else 'queued'
+        if now_iso is None:
+            now_iso = datetime.utcnow().isoformat()
+        return {
+            'to_email': to_email,
+            'from_email': from_email or DEFAULT_FROM_EMAIL,
+            'subject': subject,
+            'content': content,
+            'status': 'sent' if not failed else 'failed',
+            'service': SERVICE_NAME,
+            'template_name': template_name,
+            'sent_at': now_iso if not failed else None,
+            'metadata': {
+                'mock_mode': True,
+                'message_id': message_id,
+                'sendgrid_status': status,
+                'template_params': template_params or {},
+                'simulated_at': now_iso
+            }
+        }
+    
+    def _log_batch_to_supabase(self, table_name, rows):
+        """Insert many log rows using one request per chunk, chunks sent concurrently"""
+        def insert_chunk(chunk):
+            try:
+                self.supabase.table(table_name).insert(chunk).execute()
+            except Exception as e:
+                logger.error("Error logging batch to Supabase: %s", e)
+        
+        chunks = [rows[i:i + LOG_BATCH_SIZE] for i in range(0, len(rows), LOG_BATCH_SIZE)]
+        for future in [_EXECUTOR.submit(insert_chunk, chunk) for chunk in chunks]:
+            future.result()
+        self.invalidate_stats_cache()
+    
+    @staticmethod
+    def invalidate_stats_cache():
+        """Drop the cached get_email_stats result"""
+        get_cache().delete(STATS_CACHE_KEY)
+    
     def _simulate_delay(self, min_delay=0.5, max_delay=2.0):
         """Simulate realistic API response time"""
+        if not Config.MOCK_SIMULATE_LATENCY:
+            return
         time.sleep(random.uniform(min_delay, max_delay))
     
     def _generate_message_id(self):
         """Generate SendGrid-style message ID"""
-        return f"msg_{uuid.uuid4().hex[:16]}"
+        return f"msg_{secrets.token_hex(MESSAGE_ID_BYTES)}"
     
     def _simulate_failure(self, failure_rate=0.1):
         """Simulate random failures based on failure rate"""
         return random.random() < failure_rate
     
+    def _simulate_failures(self, count, failure_rate=0.1):
+        """Draw failure outcomes for a whole batch in one pass (batch paths use this instead of _simulate_failure)"""
+        draw = random.random
+        return [draw() < failure_rate for _ in range(count)]
+    
     def send_email(self, to_email, subject, content, from_email=None, template_name=None, template_params=None):
         """
         Mock email sending that mimics SendGrid API response structure.
@@ -47,9 +137,6 @@ class MockEmailService:
             "to": "email@example.com"
         }
         """
-        if not self.mock_mode:
-            return {"success": False, "error": "Mock mode disabled"}
-        
         # Simulate realistic response time
         self._simulate_delay(0.5, 1.5)
         
@@ -57,41 +144,27 @@ class MockEmailService:
         failed = self._simulate_failure(0.1)
         
         message_id = self._generate_message_id()
-        status = 'failed' if failed else 'queued'
+        now_iso = datetime.utcnow().isoformat()
         
         # Log to email_logs table with SendGrid-compatible structure
-        log_data = {
-            'to_email': to_email,
-            'from_email': from_email or 'noreply@futurefounders.com',
-            'subject': subject,
-            'content': content,
-            'status': 'sent' if not failed else 'failed',
-            'service': 'mock_sendgrid',
-            'template_name': template_name,
-            'sent_at': datetime.utcnow().isoformat() if not failed else None,
-            'metadata': {
-                'mock_mode': True,
-                'message_id': message_id,
-                'sendgrid_status': status,
-                'template_params': template_params or {},
-                'simulated_at': datetime.utcnow().isoformat()
-            }
-        }
-        
-        self._log_to_supabase('email_logs', log_data)
+        if Config.MOCK_LOG_FAILED_SENDS or not failed:
+            log_data = self._build_log_row(
+                to_email, subject, content, from_email, template_name, template_params,
+                message_id, failed, now_iso
+            )
+            self._log_to_supabase('email_logs', log_data)
         
         if not failed:
-            print(f"[MOCK SendGrid] ✓ Email queued to {to_email}")
-            print(f"[MOCK SendGrid] Message ID: {message_id}")
+            logger.info("[MOCK SendGrid] ✓ Email queued to %s (message_id=%s)", to_email, message_id)
             return {
                 "success": True,
                 "message_id": message_id,
                 "status": "queued",
                 "to": to_email,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso
             }
         else:
-            print(f"[MOCK SendGrid] ✗ Failed to send email to {to_email}")
+            logger.info("[MOCK SendGrid] ✗ Failed to send email to %s", to_email)
             return {
                 "success": False,
                 "error": "Simulated delivery failure",
@@ -105,6 +178,7 @@ class MockEmailService:
         
         Args:
             emails: List of email dictionaries with to_email, subject, content, etc.
+                An optional 'substitutions' dict is applied to content per recipient.
         
         Returns SendGrid-compatible batch response:
         {
@@ -115,48 +189,66 @@ class MockEmailService:
             "results": [...]
         }
         """
-        if not self.mock_mode:
-            return {"success": False, "error": "Mock mode disabled"}
-        
         # Simulate batch processing time (longer than single email)
         self._simulate_delay(1.0, 3.0)
         
-        batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+        batch_id = f"batch_{secrets.token_hex(6)}"
         results = []
         accepted = 0
         rejected = 0
         
-        for email_data in emails:
-            to_email = email_data.get('to_email')
-            subject = email_data.get('subject')
-            content = email_data.get('content')
-            template_name = email_data.get('template_name')
-            template_params = email_data.get('template_params', {})
+        # The batch is one point in time: share the timestamp, and draw every
+        # message ID from a single urandom read
+        now_iso = datetime.utcnow().isoformat()
+        id_bytes = os.urandom(MESSAGE_ID_BYTES * len(emails))
+        failures = self._simulate_failures(len(emails), 0.1)
+        
+        # Decide every outcome up front and write all log rows in one batch
+        log_rows = []
+        log_failed = Config.MOCK_LOG_FAILED_SENDS
+        # Bound once outside the loop to skip repeated attribute lookups
+        append_row = log_rows.append
+        append_result = results.append
+        build_row = self._build_log_row
+        for index, (email_data, failed) in enumerate(zip(emails, failures)):
+            get = email_data.get
+            to_email = get('to_email')
+            content = get('content')
+            for token, value in (get('substitutions') or {}).items():
+                content = content.replace(token, value)
             
-            # Send individual email
-            result = self.send_email(
-                to_email=to_email,
-                subject=subject,
-                content=content,
-                template_name=template_name,
-                template_params=template_params
-            )
+            offset = index * MESSAGE_ID_BYTES
+            message_id = f"msg_{id_bytes[offset:offset + MESSAGE_ID_BYTES].hex()}"
+            if log_failed or not failed:
+                append_row(build_row(
+                    to_email,
+                    get('subject'),
+                    content,
+                    get('from_email'),
+                    get('template_name'),
+                    get('template_params'),
+                    message_id,
+                    failed,
+                    now_iso
+                ))
             
-            if result['success']:
+            if not failed:
                 accepted += 1
-                results.append({
+                append_result({
                     "to": to_email,
                     "status": "queued",
-                    "message_id": result['message_id']
+                    "message_id": message_id
                 })
             else:
                 rejected += 1
-                results.append({
+                append_result({
                     "to": to_email,
                     "status": "rejected",
-                    "error": result.get('error', 'Unknown error')
+                    "error": "Simulated delivery failure"
                 })
         
+        self._log_batch_to_supabase('email_logs', log_rows)
+        
         response = {
             "success": True,
             "batch_id": batch_id,
@@ -164,10 +256,10 @@ class MockEmailService:
             "rejected": rejected,
             "total": len(emails),
             "results": results,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso
         }
         
-        print(f"[MOCK SendGrid] Batch {batch_id}: {accepted} accepted, {rejected} rejected")
+        logger.info("[MOCK SendGrid] Batch %s: %d accepted, %d rejected", batch_id, accepted, rejected)
         return response
     
     def get_email_status(self, message_id):
@@ -181,64 +273,50 @@ class MockEmailService:
             "events": [...]
         }
         """
-        if not self.mock_mode:
-            return {"success": False, "error": "Mock mode disabled"}
+        cache_key = f"email_status:{message_id}"
+        cached_status = get_cache().get(cache_key)
+        if cached_status is not None:
+            return cached_status
         
         self._simulate_delay(0.3, 0.8)
         
         # Simulate status progression: queued → sent → delivered
-        statuses = ['queued', 'sent', 'delivered']
-        status = random.choice(statuses)
-        
-        events = [
-            {
-                "event": "queued",
-                "timestamp": datetime.utcnow().isoformat(),
-                "reason": "Message queued for delivery"
-            }
-        ]
+        status = random.choice(_STATUSES)
+        now_iso = datetime.utcnow().isoformat()
+        events = [{**event, "timestamp": now_iso} for event in _STATUS_EVENTS[status]]
         
-        if status in ['sent', 'delivered']:
-            events.append({
-                "event": "sent",
-                "timestamp": datetime.utcnow().isoformat()
-            })
-        
-        if status == 'delivered':
-            events.append({
-                "event": "delivered",
-                "timestamp": datetime.utcnow().isoformat()
-            })
-        
-        return {
+        result = {
             "message_id": message_id,
             "status": status,
             "events": events
         }
+        get_cache().set(cache_key, result, STATUS_CACHE_TTL_SECONDS)
+        return result
     
     def get_email_stats(self):
         """Get email statistics from database"""
-        if not self.mock_mode:
-            return None
+        cached_stats = get_cache().get(STATS_CACHE_KEY)
+        if cached_stats is not None:
+            return cached_stats
         
         try:
-            # Get actual stats from Supabase
-            response = self.supabase.table('email_logs').select('*').execute()
-            all_emails = response.data if response.data else []
+            row = self._fetch_email_stats_row()
             
-            total_emails = len(all_emails)
-            sent_emails = len([e for e in all_emails if e.get('status') == 'sent'])
-            failed_emails = len([e for e in all_emails if e.get('status') == 'failed'])
+            total_emails = row.get('total') or 0
+            sent_emails = row.get('sent') or 0
+            failed_emails = row.get('failed') or 0
             
-            return {
+            stats = {
                 'total_sent': sent_emails,
                 'total_failed': failed_emails,
                 'delivery_rate': round((sent_emails / total_emails * 100), 1) if total_emails > 0 else 0,
-                'last_sent': all_emails[-1].get('sent_at') if all_emails else None,
-                'service': 'mock_sendgrid'
+                'last_sent': row.get('last_sent'),
+                'service': SERVICE_NAME
             }
+            get_cache().set(STATS_CACHE_KEY, stats, STATS_CACHE_TTL_SECONDS)
+            return stats
         except Exception as e:
-            print(f"Error getting email stats: {e}")
+            logger.error("Error getting email stats: %s", e)
             return {
                 'total_sent': 0,
                 'total_failed': 0,
@@ -247,19 +325,47 @@ class MockEmailService:
                 'error': str(e)
             }
     
+    def _fetch_email_stats_row(self):
+        """
+        Fetch aggregate email_logs counts without pulling row bodies.
+        
+        Uses the email_stats() RPC; if that migration is not applied, falls
+        back to head-only count queries that return just a Content-Range header.
+        """
+        try:
+            # Aggregate in Postgres; one row comes back regardless of table size
+            response = self.supabase.rpc('email_stats').execute()
+            return response.data or {}
+        except Exception as e:
+            logger.warning("email_stats RPC unavailable, using count queries: %s", e)
+        
+        def count(status=None):
+            query = self.supabase.table('email_logs').select('id', count='exact', head=True)
+            if status:
+                query = query.eq('status', status)
+            return query.execute().count or 0
+        
+        last = self.supabase.table('email_logs').select('sent_at') \
+            .not_.is_('sent_at', 'null') \
+            .order('sent_at', desc=True).limit(1).execute()
+        
+        return {
+            'total': count(),
+            'sent': count('sent'),
+            'failed': count('failed'),
+            'last_sent': last.data[0]['sent_at'] if last.data else None
+        }
+    
     def validate_email_template(self, template_data):
         """Mock email template validation"""
-        if not self.mock_mode:
-            return {"success": False, "error": "Mock mode disabled"}
-        
         self._simulate_delay(0.1, 0.3)
         
         # Simulate validation (95% success rate)
         failed = self._simulate_failure(0.05)
         
         if not failed:
-            template_id = f"tmpl_{uuid.uuid4().hex[:12]}"
-            print(f"[MOCK SendGrid] ✓ Template validated: {template_id}")
+            template_id = f"tmpl_{secrets.token_hex(6)}"
+            logger.info("[MOCK SendGrid] ✓ Template validated: %s", template_id)
             return {
                 "success": True,
                 "template_id": template_id,
@@ -267,9 +373,25 @@ class MockEmailService:
                 "status": "active"
             }
         else:
-            print(f"[MOCK SendGrid] ✗ Template validation failed")
+            logger.info("[MOCK SendGrid] ✗ Template validation failed")
             return {
                 "success": False,
                 "error": "Invalid template structure",
                 "error_code": "400"
-            }
\ No newline at end of file
+            }
+    
+    def _mock_mode_disabled(self, *args, **kwargs):
+        """Stand-in for every public method when mock mode is off"""
+        return {"success": False, "error": "Mock mode disabled"}
+    
+    def _stats_disabled(self):
+        """Stand-in for get_email_stats when mock mode is off"""
+        return None
+    
+    # Bind the public API once per process instead of checking mock mode per call
+    if not Config.MOCK_MODE:
+        send_email = _mock_mode_disabled
+        send_batch_emails = _mock_mode_disabled
+        get_email_status = _mock_mode_disabled
+        validate_email_template = _mock_mode_disabled
+        get_email_stats = _stats_disabled
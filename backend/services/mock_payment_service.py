@@ -1,10 +1,136 @@
 import time
+import queue
+import atexit
+import logging
 import random
+import secrets
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from utils.supabase_client import supabase
+from utils.cache import get_cache
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+# Dashboard reads (stats, link listings) are reused for a few seconds and
+# dropped whenever a payment is written
+CACHE_PREFIX = 'mock_payment:'
+STATS_CACHE_KEY = f'{CACHE_PREFIX}stats'
+READ_CACHE_TTL_SECONDS = 5
+# Single-link status only changes on completion/webhook, which invalidate it
+STATUS_CACHE_TTL_SECONDS = 30
+
+# complete_payment() stores the payment_status enum; map it back to the
+# Instamojo labels the mock reports
+PAYMENT_STATUS_LABELS = {'paid': 'Credit', 'pending': 'Pending', 'failed': 'Failed'}
+PAYMENT_STATUS_VALUES = {label: value for value, label in PAYMENT_STATUS_LABELS.items()}
+
+# Column projections per read path; metadata is merged server-side by the
+# complete_payment() RPC so reads never need the full JSONB blob.
+# Status reads go through payment_status_v, whose rows are already shaped as
+# Instamojo payment_request bodies (payments array included)
+STATUS_COLUMNS = 'id, status, amount, purpose, buyer_name, email, phone, longurl, created_at, payments'
+LINK_COLUMNS = 'id, payment_link_id, status, amount, purpose, buyer_name, email, phone, payment_url, created_at, updated_at, shorturl'
+
+# Background writer: inserts are queued and flushed in batches of up to
+# WRITE_BATCH_SIZE rows, or after WRITE_FLUSH_SECONDS, whichever comes first.
+# Each insert statement carries at most INSERT_CHUNK_SIZE rows
+WRITE_BATCH_SIZE = 100
+WRITE_FLUSH_SECONDS = 0.02
+INSERT_CHUNK_SIZE = 100
+
+# Simulated payment completions run out of band on this pool
+_COMPLETION_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='mock-payment')
+
+_write_queue = queue.Queue()
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+
+def _insert_rows_individually(table_name, rows):
+    """Retry a rejected chunk one row at a time so one bad row only loses itself"""
+    for row in rows:
+        try:
+            supabase.table(table_name).insert(row).execute()
+        except Exception:
+            logger.exception("Error logging row %s to %s", row.get('id'), table_name)
+
+
+def _flush_rows(batches):
+    """Insert queued rows with one request per table chunk"""
+    for table_name, rows in batches.items():
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + INSERT_CHUNK_SIZE]
+            try:
+                supabase.table(table_name).insert(chunk).execute()
+            except Exception:
+                logger.exception("Error logging %d rows to %s, retrying row by row", len(chunk), table_name)
+                _insert_rows_individually(table_name, chunk)
+    get_cache().delete_pattern(f'{CACHE_PREFIX}*')
+
+
+def _collect_batch(first_item):
+    """Gather queued rows behind first_item until the batch is full or the window closes"""
+    table_name, row = first_item
+    batches = {table_name: [row]}
+    deadline = time.monotonic() + WRITE_FLUSH_SECONDS
+    for _ in range(WRITE_BATCH_SIZE - 1):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            table_name, row = _write_queue.get(timeout=remaining)
+        except queue.Empty:
+            break
+        batches.setdefault(table_name, []).append(row)
+    return batches
+
+
+def _run_writer():
+    while True:
+        batches = _collect_batch(_write_queue.get())
+        try:
+            _flush_rows(batches)
+        except Exception:
+            logger.exception("Mock payment writer failed to flush a batch")
+        finally:
+            # Mark rows done only once written, so _wait_for_writes() sees them
+            for _ in range(sum(len(rows) for rows in batches.values())):
+                _write_queue.task_done()
+
+
+def _wait_for_writes():
+    """Block until every queued row has been flushed to the database"""
+    _write_queue.join()
+
+
+def _drain_writes():
+    """Flush anything still queued when the process exits"""
+    batches = {}
+    while True:
+        try:
+            table_name, row = _write_queue.get_nowait()
+        except queue.Empty:
+            break
+        batches.setdefault(table_name, []).append(row)
+    if batches:
+        try:
+            _flush_rows(batches)
+        finally:
+            for _ in range(sum(len(rows) for rows in batches.values())):
+                _write_queue.task_done()
+
+
+def _ensure_writer():
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_run_writer, name='mock-payment-writer', daemon=True)
+            _writer_thread.start()
+            atexit.register(_drain_writes)
+
 class MockPaymentService:
     """
     Mock Payment Service that mimics Instamojo Payment Gateway API
@@ -17,36 +143,50 @@ class MockPaymentService:
     - Transaction logging to database
     
     Response structure matches Instamojo API v1.1 exactly.
+    
+    Only instantiated in mock mode (see get_payment_service), so methods do
+    not re-check MOCK_MODE per call.
     """
     
-    def __init__(self):
+    def __init__(self, rng=None):
         self.mock_mode = Config.MOCK_MODE
         self.supabase = supabase
+        # Private PRNG stream; pass a seeded random.Random for deterministic tests
+        self._rng = rng or random.Random()
+        _ensure_writer()
     
     def _log_to_supabase(self, table_name, data):
-        """Log mock service actions to Supabase for visibility"""
-        try:
-            response = self.supabase.table(table_name).insert(data).execute()
-            return response.data[0] if response.data else None
-        except Exception as e:
-            print(f"Error logging to Supabase: {e}")
-            return None
+        """
+        Queue a mock service row for the background batch writer.
+        
+        Returns the row optimistically; callers pre-generate its id. Paths
+        that read these rows back call _wait_for_writes() first.
+        """
+        _write_queue.put((table_name, data))
+        return data
+    
+    @staticmethod
+    def invalidate_read_cache():
+        """Drop cached payment stats and link listings"""
+        get_cache().delete_pattern(f'{CACHE_PREFIX}*')
     
     def _simulate_delay(self, min_sec=0.3, max_sec=1.0):
         """Simulate realistic API response time"""
-        time.sleep(random.uniform(min_sec, max_sec))
+        if not Config.MOCK_SIMULATE_LATENCY:
+            return
+        time.sleep(self._rng.uniform(min_sec, max_sec))
     
     def _simulate_failure(self, failure_rate=0.02):
         """Simulate occasional API failures"""
-        return random.random() < failure_rate
+        return self._rng.random() < failure_rate
     
     def _generate_payment_request_id(self):
         """Generate Instamojo-style payment request ID"""
-        return f"PR_{uuid.uuid4().hex[:16].upper()}"
+        return f"PR_{secrets.token_hex(8).upper()}"
     
     def _generate_payment_id(self):
         """Generate Instamojo-style payment ID for completed payments"""
-        return f"MOJO{random.randint(1000000000, 9999999999)}"
+        return f"MOJO{self._rng.randint(1000000000, 9999999999)}"
     
     def create_payment_link(self, amount, purpose, buyer_name, email, phone, redirect_url=None):
         """
@@ -70,14 +210,11 @@ class MockPaymentService:
             }
         }
         """
-        if not self.mock_mode:
-            return {"success": False, "error": "Mock mode disabled"}
-        
         self._simulate_delay(0.3, 0.8)
         
         # Simulate occasional failures (2% failure rate)
         if self._simulate_failure(0.02):
-            print(f"[MOCK Instamojo] ✗ Failed to create payment link for {buyer_name}")
+            logger.info("[MOCK Instamojo] ✗ Failed to create payment link for %s", buyer_name)
             return {
                 "success": False,
                 "message": "Unable to create payment request",
@@ -86,10 +223,11 @@ class MockPaymentService:
         
         payment_request_id = self._generate_payment_request_id()
         internal_id = str(uuid.uuid4())
+        now_iso = datetime.utcnow().isoformat()
         
         # Generate mock URLs (Instamojo style)
         longurl = f"https://test.instamojo.com/@mock/{payment_request_id.lower()}"
-        shorturl = f"https://imjo.in/{uuid.uuid4().hex[:8]}"
+        shorturl = f"https://imjo.in/{secrets.token_hex(4)}"
         
         # Log to payments table
         payment_data = {
@@ -100,26 +238,26 @@ class MockPaymentService:
             'buyer_name': buyer_name,
             'email': email,
             'phone': phone,
-            'status': 'Pending',
+            'status': 'pending',
             'payment_url': longurl,
-            'service': 'mock_instamojo',
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat(),
+            'created_at': now_iso,
+            'updated_at': now_iso,
+            'shorturl': shorturl,
+            'redirect_url': redirect_url or "http://localhost:3000/payment/success",
+            'webhook_url': "http://localhost:5000/webhook/payment",
             'metadata': {
                 'mock_mode': True,
-                'payment_request_id': payment_request_id,
-                'shorturl': shorturl,
-                'redirect_url': redirect_url or "http://localhost:3000/payment/success",
-                'webhook_url': "http://localhost:5000/webhook/payment"
+                'service': 'mock_instamojo',
+                'payment_request_id': payment_request_id
             }
         }
         
         self._log_to_supabase('payments', payment_data)
         
-        print(f"[MOCK Instamojo] ✓ Payment link created")
-        print(f"[MOCK Instamojo] Request ID: {payment_request_id}")
-        print(f"[MOCK Instamojo] Amount: ₹{amount} - {purpose}")
-        print(f"[MOCK Instamojo] URL: {longurl}")
+        logger.info(
+            "[MOCK Instamojo] ✓ Payment link created: %s (₹%s - %s) %s",
+            payment_request_id, amount, purpose, longurl
+        )
         
         return {
             'success': True,
@@ -131,19 +269,35 @@ class MockPaymentService:
                 'buyer_name': buyer_name,
                 'amount': f"{amount:.2f}",
                 'purpose': purpose,
-                'status': 'Pending',
+                'status': PAYMENT_STATUS_LABELS[payment_data['status']],
                 'longurl': longurl,
                 'shorturl': shorturl,
                 'redirect_url': redirect_url or "http://localhost:3000/payment/success",
                 'webhook': "http://localhost:5000/webhook/payment",
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': now_iso
             }
         }
     
-    def simulate_payment_completion(self, payment_request_id, success_rate=0.75):
+    def _complete_payment(self, payment_request_id, status, payment_id, metadata):
+        """Update status and merge metadata atomically via the complete_payment() RPC"""
+        # The link may still be queued if it was created moments ago
+        _wait_for_writes()
+        response = self.supabase.rpc('complete_payment', {
+            'p_payment_link_id': payment_request_id,
+            'p_status': status,
+            'p_payment_id': payment_id,
+            'p_metadata': metadata
+        }).execute()
+        self.invalidate_read_cache()
+        return response
+    
+    def simulate_payment_completion(self, payment_request_id, success_rate=0.75, payment_successful=None):
         """
         Simulate payment completion webhook (auto-triggered after delay).
         
+        payment_successful forces the outcome; by default it is drawn from
+        success_rate.
+        
         Returns Instamojo webhook payload:
         {
             "payment_id": "MOJO1234567890",
@@ -155,21 +309,10 @@ class MockPaymentService:
             "buyer_phone": "+911234567890"
         }
         """
-        if not self.mock_mode:
-            return {"success": False, "error": "Mock mode disabled"}
-        
         try:
-            # Get payment from Supabase by payment_request_id
-            response = self.supabase.table('payments').select('*').eq('payment_link_id', payment_request_id).execute()
-            
-            if not response.data:
-                print(f"[MOCK Instamojo] Payment request {payment_request_id} not found")
-                return {"success": False, "error": "Payment request not found"}
-            
-            payment = response.data[0]
-            
             # Simulate payment outcome (default 75% success)
-            payment_successful = random.random() < success_rate
+            if payment_successful is None:
+                payment_successful = self._rng.random() < success_rate
             
             if payment_successful:
                 new_status = 'Credit'  # Instamojo uses "Credit" for successful payments
@@ -177,41 +320,38 @@ class MockPaymentService:
             else:
                 new_status = 'Failed'
                 payment_id = None
+            now_iso = datetime.utcnow().isoformat()
             
-            # Update payment status in database
-            update_data = {
-                'status': new_status,
-                'updated_at': datetime.utcnow().isoformat(),
-                'metadata': {
-                    **payment.get('metadata', {}),
-                    'payment_completed': True,
-                    'external_payment_id': payment_id,
-                    'payment_mode': random.choice(['Credit Card', 'Debit Card', 'Net Banking', 'UPI', 'Wallet']),
-                    'webhook_triggered': True,
-                    'completed_at': datetime.utcnow().isoformat()
-                }
-            }
+            # Update status and merge metadata in one round-trip
+            response = self._complete_payment(payment_request_id, new_status, payment_id, {
+                'payment_completed': True,
+                'payment_mode': self._rng.choice(['Credit Card', 'Debit Card', 'Net Banking', 'UPI', 'Wallet']),
+                'webhook_triggered': True,
+                'completed_at': now_iso
+            })
             
-            if payment_id:
-                update_data['external_payment_id'] = payment_id
+            if not response.data:
+                logger.info("[MOCK Instamojo] Payment request %s not found", payment_request_id)
+                return {"success": False, "error": "Payment request not found"}
             
-            self.supabase.table('payments').update(update_data).eq('id', payment['id']).execute()
+            payment = response.data[0]
+            amount = payment['amount']
             
-            print(f"[MOCK Instamojo] ✓ Payment {payment_request_id} completed: {new_status}")
+            logger.info("[MOCK Instamojo] ✓ Payment %s completed: %s", payment_request_id, new_status)
             
             # Return webhook payload format
             webhook_payload = {
                 'payment_id': payment_id if payment_id else None,
                 'payment_request_id': payment_request_id,
                 'status': new_status,
-                'amount': f"{payment['amount']:.2f}",
+                'amount': format(amount, '.2f'),
                 'buyer_name': payment['buyer_name'],
                 'buyer_email': payment['email'],
                 'buyer_phone': payment['phone'],
                 'currency': 'INR',
-                'fees': f"{payment['amount'] * 0.02:.2f}",  # 2% mock fee
-                'mac': uuid.uuid4().hex,  # Mock MAC signature
-                'created_at': datetime.utcnow().isoformat()
+                'fees': format(amount * 0.02, '.2f'),  # 2% mock fee
+                'mac': secrets.token_hex(16),  # Mock MAC signature
+                'created_at': now_iso
             }
             
             return {
@@ -220,9 +360,37 @@ class MockPaymentService:
             }
             
         except Exception as e:
-            print(f"[MOCK Instamojo] Error simulating payment completion: {e}")
+            logger.error("[MOCK Instamojo] Error simulating payment completion: %s", e)
             return {"success": False, "error": str(e)}
     
+    def schedule_payment_completion(self, payment_request_id, success_rate=0.75):
+        """
+        Fire-and-forget variant of simulate_payment_completion.
+        
+        Returns:
+            Future resolving to the simulate_payment_completion result; call
+            .result() where a synchronous answer is needed.
+        """
+        return _COMPLETION_EXECUTOR.submit(self.simulate_payment_completion, payment_request_id, success_rate)
+    
+    def simulate_payment_completions(self, payment_request_ids, success_rate=0.75):
+        """
+        Simulate completion for many payment links, e.g. a webhook flood in a load test.
+        
+        Outcomes are drawn for the whole batch in one pass, then the
+        complete_payment() calls run concurrently on the completion pool.
+        
+        Returns:
+            List of simulate_payment_completion results, in input order
+        """
+        ids = list(payment_request_ids)
+        draw = self._rng.random
+        outcomes = [draw() < success_rate for _ in ids]
+        return list(_COMPLETION_EXECUTOR.map(
+            lambda pair: self.simulate_payment_completion(pair[0], payment_successful=pair[1]),
+            zip(ids, outcomes)
+        ))
+    
     def get_payment_status(self, payment_request_id):
         """
         Mock payment status check (Instamojo format).
@@ -240,48 +408,69 @@ class MockPaymentService:
             }
         }
         """
-        if not self.mock_mode:
-            return {"success": False, "error": "Mock mode disabled"}
+        cache_key = f'{CACHE_PREFIX}status:{payment_request_id}'
+        cached_status = get_cache().get(cache_key)
+        if cached_status is not None:
+            return cached_status
         
         try:
-            response = self.supabase.table('payments').select('*').eq('payment_link_id', payment_request_id).execute()
+            _wait_for_writes()
+            response = self.supabase.table('payment_status_v') \
+                .select(STATUS_COLUMNS) \
+                .eq('id', payment_request_id) \
+                .limit(1) \
+                .maybe_single() \
+                .execute()
             
-            if response.data:
-                payment = response.data[0]
-                
-                # Build payments array if completed
-                payments_array = []
-                if payment['status'] == 'Credit' and payment.get('external_payment_id'):
-                    payments_array.append({
-                        'payment_id': payment['external_payment_id'],
-                        'amount': f"{payment['amount']:.2f}",
-                        'status': 'Credit',
-                        'buyer_name': payment['buyer_name'],
-                        'buyer_email': payment['email'],
-                        'buyer_phone': payment['phone'],
-                        'created_at': payment.get('updated_at', payment['created_at'])
-                    })
-                
-                return {
+            # Some supabase-py releases return None instead of an empty response
+            if response is not None and response.data:
+                result = {
                     'success': True,
-                    'payment_request': {
-                        'id': payment['payment_link_id'],
-                        'status': payment['status'],
-                        'amount': f"{payment['amount']:.2f}",
-                        'purpose': payment['purpose'],
-                        'buyer_name': payment['buyer_name'],
-                        'email': payment['email'],
-                        'phone': payment['phone'],
-                        'longurl': payment['payment_url'],
-                        'created_at': payment['created_at'],
-                        'payments': payments_array
-                    }
+                    'payment_request': response.data
                 }
+                get_cache().set(cache_key, result, STATUS_CACHE_TTL_SECONDS)
+                return result
             else:
                 return {"success": False, "error": "Payment request not found"}
                 
         except Exception as e:
-            print(f"[MOCK Instamojo] Error getting payment status: {e}")
+            logger.error("[MOCK Instamojo] Error getting payment status: %s", e)
+            return {"success": False, "error": str(e)}
+    
+    def get_payment_statuses(self, payment_request_ids):
+        """
+        Batched payment status check for dashboards refreshing many links.
+        
+        Args:
+            payment_request_ids: Iterable of payment request IDs
+        
+        Returns:
+            {"success": True, "payment_requests": {id: payment_request, ...}}
+            Unknown IDs are omitted.
+        """
+        ids = list(dict.fromkeys(payment_request_ids))
+        if not ids:
+            return {"success": True, "payment_requests": {}}
+        
+        try:
+            # One IN query instead of a lookup per link
+            _wait_for_writes()
+            response = self.supabase.table('payment_status_v') \
+                .select(STATUS_COLUMNS) \
+                .in_('id', ids) \
+                .execute()
+            
+            payment_requests = {}
+            for payment_request in response.data or []:
+                payment_requests.setdefault(payment_request['id'], payment_request)
+            
+            return {
+                'success': True,
+                'payment_requests': payment_requests
+            }
+                
+        except Exception as e:
+            logger.error("[MOCK Instamojo] Error getting payment statuses: %s", e)
             return {"success": False, "error": str(e)}
     
     def get_payment_links(self, limit=10, status=None):
@@ -290,62 +479,65 @@ class MockPaymentService:
         
         Returns array of payment requests.
         """
-        if not self.mock_mode:
-            return {"success": False, "error": "Mock mode disabled"}
+        cache_key = f'{CACHE_PREFIX}links:{limit}:{status or "all"}'
+        cached_links = get_cache().get(cache_key)
+        if cached_links is not None:
+            return cached_links
         
         try:
-            query = self.supabase.table('payments').select('*').order('created_at', desc=True).limit(limit)
+            query = self.supabase.table('payments').select(LINK_COLUMNS).order('created_at', desc=True).limit(limit)
             
             if status:
-                query = query.eq('status', status)
+                # Callers filter by Instamojo label; the column holds the enum value
+                query = query.eq('status', PAYMENT_STATUS_VALUES.get(status, status))
             
             response = query.execute()
             
             if response.data:
-                payment_requests = []
-                for payment in response.data:
-                    payment_requests.append({
+                # Pre-sized and filled by index instead of growing with append
+                payment_requests = [None] * len(response.data)
+                for index, payment in enumerate(response.data):
+                    payment_requests[index] = {
                         'id': payment['payment_link_id'],
                         'internal_id': payment['id'],
                         'longurl': payment['payment_url'],
-                        'shorturl': payment.get('metadata', {}).get('shorturl', ''),
-                        'amount': f"{payment['amount']:.2f}",
+                        'shorturl': payment.get('shorturl') or '',
+                        'amount': format(payment['amount'], '.2f'),
                         'purpose': payment['purpose'],
                         'buyer_name': payment['buyer_name'],
                         'email': payment['email'],
                         'phone': payment['phone'],
-                        'status': payment['status'],
+                        'status': PAYMENT_STATUS_LABELS.get(payment['status'], payment['status']),
                         'created_at': payment['created_at'],
                         'modified_at': payment.get('updated_at', payment['created_at'])
-                    })
+                    }
                 
-                return {
+                result = {
                     'success': True,
                     'payment_requests': payment_requests
                 }
             else:
-                return {
+                result = {
                     'success': True,
                     'payment_requests': []
                 }
+            get_cache().set(cache_key, result, READ_CACHE_TTL_SECONDS)
+            return result
                 
         except Exception as e:
-            print(f"[MOCK Instamojo] Error getting payment links: {e}")
+            logger.error("[MOCK Instamojo] Error getting payment links: %s", e)
             return {"success": False, "error": str(e)}
     
     def resend_payment_link(self, payment_request_id):
         """Mock payment link resend (via email/SMS)"""
-        if not self.mock_mode:
-            return {"success": False, "error": "Mock mode disabled"}
-        
         self._simulate_delay(0.2, 0.5)
         
         # Simulate resend success (95% success rate)
         if self._simulate_failure(0.05):
-            print(f"[MOCK Instamojo] ✗ Failed to resend payment link {payment_request_id}")
+            logger.info("[MOCK Instamojo] ✗ Failed to resend payment link %s", payment_request_id)
             return {"success": False, "error": "Failed to send notification"}
         
-        print(f"[MOCK Instamojo] ✓ Payment link {payment_request_id} resent successfully")
+        logger.info("[MOCK Instamojo] ✓ Payment link %s resent successfully", payment_request_id)
         return {
             "success": True,
             "message": "Payment link sent via email and SMS",
@@ -366,9 +558,6 @@ class MockPaymentService:
             "buyer_email": "buyer@example.com"
         }
         """
-        if not self.mock_mode:
-            return {"success": False, "error": "Mock mode disabled"}
-        
         self._simulate_delay(0.1, 0.3)
         
         payment_request_id = webhook_data.get('payment_request_id')
@@ -376,89 +565,101 @@ class MockPaymentService:
         payment_id = webhook_data.get('payment_id')
         
         if not payment_request_id or not status:
-            print("[MOCK Instamojo] ✗ Invalid webhook data")
+            logger.warning("[MOCK Instamojo] ✗ Invalid webhook data")
             return {"success": False, "error": "Missing required fields"}
         
         try:
-            # Find payment by payment_request_id
-            response = self.supabase.table('payments').select('*').eq('payment_link_id', payment_request_id).execute()
+            now_iso = datetime.utcnow().isoformat()
+            
+            # Update payment with webhook data, merging metadata server-side
+            response = self._complete_payment(payment_request_id, status, payment_id, {
+                'webhook_received': True,
+                'webhook_data': webhook_data,
+                'webhook_timestamp': now_iso
+            })
             
             if not response.data:
                 return {"success": False, "error": "Payment request not found"}
             
-            payment = response.data[0]
-            
-            # Update payment with webhook data
-            update_data = {
-                'status': status,
-                'external_payment_id': payment_id,
-                'updated_at': datetime.utcnow().isoformat(),
-                'metadata': {
-                    **payment.get('metadata', {}),
-                    'webhook_received': True,
-                    'webhook_data': webhook_data,
-                    'webhook_timestamp': datetime.utcnow().isoformat()
-                }
-            }
-            
-            self.supabase.table('payments').update(update_data).eq('id', payment['id']).execute()
-            
-            print(f"[MOCK Instamojo] ✓ Webhook processed: {payment_request_id} → {status}")
+            logger.info("[MOCK Instamojo] ✓ Webhook processed: %s → %s", payment_request_id, status)
             
             return {
                 'success': True,
                 'payment_request_id': payment_request_id,
                 'status': status,
-                'processed_at': datetime.utcnow().isoformat()
+                'processed_at': now_iso
             }
             
         except Exception as e:
-            print(f"[MOCK Instamojo] Error processing webhook: {e}")
+            logger.error("[MOCK Instamojo] Error processing webhook: %s", e)
             return {"success": False, "error": str(e)}
     
+    def _fetch_payment_stats_row(self):
+        """
+        Fetch per-status payment counts and amounts.
+        
+        Uses the get_payment_stats() RPC so only a handful of scalars cross
+        the wire; falls back to reading status/amount columns if that
+        migration is not applied.
+        """
+        try:
+            response = self.supabase.rpc('get_payment_stats').execute()
+            return response.data or {}
+        except Exception as e:
+            logger.warning("[MOCK Instamojo] get_payment_stats RPC unavailable, aggregating locally: %s", e)
+        
+        response = self.supabase.table('payments').select('status, amount').execute()
+        payments = response.data or []
+        
+        # One pass over the rows for every count and sum
+        counts = {'Credit': 0, 'Pending': 0, 'Failed': 0}
+        amounts = {'Credit': 0, 'Pending': 0, 'Failed': 0}
+        total_amount = 0
+        for payment in payments:
+            status = payment['status']
+            status = PAYMENT_STATUS_LABELS.get(status, status)
+            amount = payment['amount'] or 0
+            total_amount += amount
+            if status in counts:
+                counts[status] += 1
+                amounts[status] += amount
+        
+        return {
+            'total_requests': len(payments),
+            'total_paid': counts['Credit'],
+            'total_pending': counts['Pending'],
+            'total_failed': counts['Failed'],
+            'total_amount': total_amount,
+            'paid_amount': amounts['Credit'],
+            'pending_amount': amounts['Pending']
+        }
+    
     def get_payment_stats(self):
         """Get payment statistics from database"""
-        if not self.mock_mode:
-            return None
+        cached_stats = get_cache().get(STATS_CACHE_KEY)
+        if cached_stats is not None:
+            return cached_stats
         
         try:
-            response = self.supabase.table('payments').select('*').execute()
+            row = self._fetch_payment_stats_row()
             
-            if response.data:
-                payments = response.data
-                total_links = len(payments)
-                paid_count = len([p for p in payments if p['status'] == 'Credit'])
-                pending_count = len([p for p in payments if p['status'] == 'Pending'])
-                failed_count = len([p for p in payments if p['status'] == 'Failed'])
-                
-                total_amount = sum(p['amount'] for p in payments)
-                paid_amount = sum(p['amount'] for p in payments if p['status'] == 'Credit')
-                pending_amount = sum(p['amount'] for p in payments if p['status'] == 'Pending')
-                
-                return {
-                    'total_requests': total_links,
-                    'total_paid': paid_count,
-                    'total_pending': pending_count,
-                    'total_failed': failed_count,
-                    'total_amount': round(total_amount, 2),
-                    'paid_amount': round(paid_amount, 2),
-                    'pending_amount': round(pending_amount, 2),
-                    'conversion_rate': round((paid_count / total_links * 100) if total_links > 0 else 0, 1),
-                    'service': 'mock_instamojo'
-                }
-            else:
-                return {
-                    'total_requests': 0,
-                    'total_paid': 0,
-                    'total_pending': 0,
-                    'total_failed': 0,
-                    'total_amount': 0,
-                    'paid_amount': 0,
-                    'pending_amount': 0,
-                    'conversion_rate': 0,
-                    'service': 'mock_instamojo'
-                }
+            total_links = row.get('total_requests') or 0
+            paid_count = row.get('total_paid') or 0
+            
+            stats = {
+                'total_requests': total_links,
+                'total_paid': paid_count,
+                'total_pending': row.get('total_pending') or 0,
+                'total_failed': row.get('total_failed') or 0,
+                'total_amount': round(float(row.get('total_amount') or 0), 2),
+                'paid_amount': round(float(row.get('paid_amount') or 0), 2),
+                'pending_amount': round(float(row.get('pending_amount') or 0), 2),
+                'conversion_rate': round((paid_count / total_links * 100) if total_links > 0 else 0, 1),
+                'service': 'mock_instamojo'
+            }
+            get_cache().set(STATS_CACHE_KEY, stats, READ_CACHE_TTL_SECONDS)
+            return stats
                 
         except Exception as e:
-            print(f"[MOCK Instamojo] Error getting stats: {e}")
-            return None
\ No newline at end of file
+            logger.error("[MOCK Instamojo] Error getting stats: %s", e)
+            return None
@@ -1,10 +1,42 @@
 import time
+import logging
 import random
+import secrets
 import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from utils.supabase_client import supabase
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+# Rows per bulk insert request, keeps payloads under PostgREST body limits
+INSERT_CHUNK_SIZE = 1000
+
+# Columns returned by get_call_logs; skips the metadata JSON blob
+CALL_LOG_COLUMNS = 'id, phone, call_script_id, status, duration_seconds, timestamp'
+
+# Values shared by every logged outbound call and its crm_messages mirror
+_SERVICE = 'mock_bolna'
+_CHANNEL_CALL = 'call'
+_SENDER_ADMIN = 'admin'
+_DIR_OUTBOUND = 'outbound'
+_STATUS_INITIATED = 'initiated'
+
+# Columns read by get_call_status
+CALL_STATUS_COLUMNS = 'call_id, status, phone, agent_id, campaign_id, duration_seconds, timestamp, updated_at, metadata'
+
+# Status groups used by the call stats
+_COMPLETED_STATUSES = frozenset(('completed', 'answered'))
+_FAILED_STATUSES = ('busy', 'no_answer', 'failed')
+_ACTIVE_STATUSES = ('initiated', 'ringing', 'connected')
+
+# Simulated call outcomes and their weights:
+# completed 65%, answered but incomplete 15%, no answer 10%, busy 5%, technical failure 5%
+_OUTCOMES = ('completed', 'answered', 'no_answer', 'busy', 'failed')
+_OUTCOME_WEIGHTS = (0.65, 0.15, 0.10, 0.05, 0.05)
+
 class MockVoiceService:
     """
     Mock Voice Service that mimics Bolna.ai Voice Call API
@@ -20,9 +52,14 @@ class MockVoiceService:
     Response structure matches Bolna.ai API exactly.
     """
     
-    def __init__(self):
+    def __init__(self, rng=None):
         self.mock_mode = Config.MOCK_MODE
         self.supabase = supabase
+        # Per-instance generator so simulations don't contend on the module-level one
+        self._rng = rng or random.Random()
+        # Writes for single calls run off the request path; owned by this
+        # instance so shutdown() cannot strand other services
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='mock-voice')
     
     def _log_to_supabase(self, table_name, data):
         """Log mock service actions to Supabase for visibility"""
@@ -30,20 +67,77 @@ class MockVoiceService:
             response = self.supabase.table(table_name).insert(data).execute()
             return response.data[0] if response.data else None
         except Exception as e:
-            print(f"Error logging to Supabase: {e}")
+            logger.error("Error logging to Supabase: %s", e)
             return None
     
+    def _log_batch_to_supabase(self, table_name, rows):
+        """Insert many rows with one request per INSERT_CHUNK_SIZE chunk"""
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            try:
+                self.supabase.table(table_name).insert(rows[start:start + INSERT_CHUNK_SIZE]).execute()
+            except Exception as e:
+                logger.error("Error logging batch to Supabase: %s", e)
+    
+    def _log_outbound_call(self, call_data, crm_data):
+        """Insert a call and its CRM mirror in one round trip via the log_outbound_call() RPC"""
+        try:
+            self.supabase.rpc('log_outbound_call', {
+                'p_call': call_data,
+                'p_crm': crm_data
+            }).execute()
+        except Exception as e:
+            logger.error("Error logging call to Supabase: %s", e)
+    
+    def _build_call_rows(self, internal_id, call_id, to_number, agent_id, campaign_id, metadata, now_iso):
+        """Build the call_logs row and its crm_messages mirror for an outbound call"""
+        call_data = {
+            'id': internal_id,
+            'call_id': call_id,
+            'phone': to_number,
+            'agent_id': agent_id,
+            'campaign_id': campaign_id,
+            'status': _STATUS_INITIATED,
+            'timestamp': now_iso,
+            'updated_at': now_iso,
+            'metadata': {
+                'mock_mode': True,
+                'service': _SERVICE,
+                'custom_metadata': metadata or {},
+                'call_type': 'automated_ai'
+            }
+        }
+        
+        # Also log to crm_messages for unified view
+        crm_data = {
+            'id': str(uuid.uuid4()),
+            'user_id': None,  # Would be populated with actual lead ID
+            'channel': _CHANNEL_CALL,
+            'sender': _SENDER_ADMIN,
+            'message': f"AI call with agent: {agent_id}",
+            'delivery_status': 'sent',
+            'external_message_id': call_id,
+            'timestamp': now_iso,
+            'metadata': {
+                'direction': _DIR_OUTBOUND,
+                'service': _SERVICE
+            }
+        }
+        
+        return call_data, crm_data
+    
     def _simulate_delay(self, min_sec=0.3, max_sec=1.0):
         """Simulate realistic API response time"""
-        time.sleep(random.uniform(min_sec, max_sec))
+        if not Config.MOCK_SIMULATE_LATENCY:
+            return
+        time.sleep(self._rng.uniform(min_sec, max_sec))
     
     def _simulate_failure(self, failure_rate=0.05):
         """Simulate occasional API failures"""
-        return random.random() < failure_rate
+        return self._rng.random() < failure_rate
     
     def _generate_call_id(self):
         """Generate Bolna.ai-style call ID"""
-        return f"call_{uuid.uuid4().hex[:16]}"
+        return f"call_{secrets.token_hex(8)}"
     
     def _generate_recording_url(self, call_id):
         """Generate mock recording URL"""
@@ -71,7 +165,7 @@ class MockVoiceService:
         
         # Simulate occasional failures (5% failure rate)
         if self._simulate_failure(0.05):
-            print(f"[MOCK Bolna.ai] ✗ Failed to initiate call to {to_number}")
+            logger.info("[MOCK Bolna.ai] ✗ Failed to initiate call to %s", to_number)
             return {
                 "success": False,
                 "error": "Failed to initiate call",
@@ -81,47 +175,21 @@ class MockVoiceService:
         
         call_id = self._generate_call_id()
         internal_id = str(uuid.uuid4())
+        now_iso = datetime.utcnow().isoformat()
         
         # Log to call_logs table
-        call_data = {
-            'id': internal_id,
-            'call_id': call_id,
-            'to_number': to_number,
-            'agent_id': agent_id,
-            'campaign_id': campaign_id,
-            'status': 'initiated',
-            'service': 'mock_bolna',
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat(),
-            'metadata': {
-                'mock_mode': True,
-                'custom_metadata': metadata or {},
-                'call_type': 'automated_ai'
-            }
-        }
-        
-        # Also log to crm_messages for unified view
-        crm_data = {
-            'id': str(uuid.uuid4()),
-            'lead_id': None,  # Would be populated with actual lead ID
-            'channel': 'voice',
-            'direction': 'outbound',
-            'content': f"AI call with agent: {agent_id}",
-            'status': 'sent',
-            'external_message_id': call_id,
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat()
-        }
-        
-        self._log_to_supabase('call_logs', call_data)
-        self._log_to_supabase('crm_messages', crm_data)
+        call_data, crm_data = self._build_call_rows(
+            internal_id, call_id, to_number, agent_id, campaign_id, metadata, now_iso
+        )
         
-        # Simulate call progression in background
-        self._simulate_call_progression(internal_id, call_id)
+        # Log and simulate call progression in background, in order so the
+        # ringing update always lands after the insert
+        self._executor.submit(self._record_call, internal_id, call_id, call_data, crm_data, now_iso)
         
-        print(f"[MOCK Bolna.ai] ✓ Call initiated to {to_number}")
-        print(f"[MOCK Bolna.ai] Call ID: {call_id}")
-        print(f"[MOCK Bolna.ai] Agent: {agent_id}")
+        logger.info(
+            "[MOCK Bolna.ai] ✓ Call initiated to %s (Call ID: %s, Agent: %s)",
+            to_number, call_id, agent_id
+        )
         
         return {
             "success": True,
@@ -131,44 +199,43 @@ class MockVoiceService:
             "to_number": to_number,
             "status": "initiated",
             "campaign_id": campaign_id,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": now_iso
         }
     
-    def _simulate_call_progression(self, internal_id, call_id):
+    def _record_call(self, internal_id, call_id, call_data, crm_data, now_iso):
+        """Persist an initiated call, then advance it to ringing"""
+        self._log_outbound_call(call_data, crm_data)
+        self._simulate_call_progression(internal_id, call_id, now_iso)
+    
+    def shutdown(self, wait=True):
+        """Stop this instance's background writes and optionally wait for queued ones"""
+        self._executor.shutdown(wait=wait)
+    
+    def _simulate_call_progression(self, internal_id, call_id, now_iso=None):
         """
         Simulate call progression through states:
         initiated → ringing → connected → completed/failed
         """
         # In production, this would be a background job
         # For now, update to ringing immediately
+        now_iso = now_iso or datetime.utcnow().isoformat()
         try:
             # Update to ringing state
             self.supabase.table('call_logs').update({
                 'status': 'ringing',
-                'updated_at': datetime.utcnow().isoformat()
+                'updated_at': now_iso
             }).eq('id', internal_id).execute()
             
             # Simulate call answer/completion (would happen after 15-60 seconds)
             # Randomly determine call outcome
-            outcomes = [
-                ('completed', 0.65),  # 65% - successful call
-                ('answered', 0.15),   # 15% - answered but incomplete
-                ('no_answer', 0.10),  # 10% - no answer
-                ('busy', 0.05),       # 5% - busy
-                ('failed', 0.05)      # 5% - technical failure
-            ]
-            
-            outcome_status = random.choices(
-                [o[0] for o in outcomes],
-                weights=[o[1] for o in outcomes]
-            )[0]
+            outcome_status = self._rng.choices(_OUTCOMES, _OUTCOME_WEIGHTS)[0]
             
             # Calculate duration based on outcome
-            if outcome_status in ['completed', 'answered']:
-                duration = random.randint(45, 420)  # 45 seconds to 7 minutes
+            if outcome_status in _COMPLETED_STATUSES:
+                duration = self._rng.randint(45, 420)  # 45 seconds to 7 minutes
                 recording_url = self._generate_recording_url(call_id)
             else:
-                duration = random.randint(5, 25)  # 5-25 seconds for failed
+                duration = self._rng.randint(5, 25)  # 5-25 seconds for failed
                 recording_url = None
             
             # Build transcript (mock)
@@ -191,13 +258,13 @@ class MockVoiceService:
                 'outcome': outcome_status,
                 'recording_url': recording_url,
                 'transcript': transcript,
-                'completed_at': datetime.utcnow().isoformat()
+                'completed_at': now_iso
             }
             
-            print(f"[MOCK Bolna.ai] ✓ Call {call_id} progression: {outcome_status} (Duration: {duration}s)")
+            logger.info("[MOCK Bolna.ai] ✓ Call %s progression: %s (Duration: %ss)", call_id, outcome_status, duration)
             
         except Exception as e:
-            print(f"[MOCK Bolna.ai] Error simulating call progression: {e}")
+            logger.error("[MOCK Bolna.ai] Error simulating call progression: %s", e)
     
     def make_bulk_calls(self, contacts, agent_id, campaign_id=None):
         """
@@ -219,33 +286,51 @@ class MockVoiceService:
         
         results = {
             'success': True,
-            'campaign_id': campaign_id or f"camp_{uuid.uuid4().hex[:12]}",
+            'campaign_id': campaign_id or f"camp_{secrets.token_hex(6)}",
             'initiated': 0,
             'failed': 0,
             'call_ids': []
         }
         
+        # Build every row up front, then write each table in bulk
+        now_iso = datetime.utcnow().isoformat()
+        call_rows = []
+        crm_rows = []
         for contact in contacts:
             phone_number = contact.get('phone_number') or contact.get('phone')
             
-            if not phone_number:
+            if not phone_number or self._simulate_failure(0.05):
                 results['failed'] += 1
                 continue
             
-            call_result = self.make_call(
-                phone_number,
-                agent_id,
-                campaign_id=results['campaign_id'],
-                metadata=contact.get('metadata')
+            call_id = self._generate_call_id()
+            call_data, crm_data = self._build_call_rows(
+                str(uuid.uuid4()), call_id, phone_number, agent_id,
+                results['campaign_id'], contact.get('metadata'), now_iso
             )
-            
-            if call_result.get('success'):
-                results['initiated'] += 1
-                results['call_ids'].append(call_result['call_id'])
-            else:
-                results['failed'] += 1
+            call_rows.append(call_data)
+            crm_rows.append(crm_data)
+            results['initiated'] += 1
+            results['call_ids'].append(call_id)
         
-        print(f"[MOCK Bolna.ai] ✓ Bulk campaign completed: {results['initiated']} initiated, {results['failed']} failed")
+        self._log_batch_to_supabase('call_logs', call_rows)
+        self._log_batch_to_supabase('crm_messages', crm_rows)
+        
+        # Move the whole batch to ringing with one update per chunk
+        internal_ids = [row['id'] for row in call_rows]
+        for start in range(0, len(internal_ids), INSERT_CHUNK_SIZE):
+            try:
+                self.supabase.table('call_logs').update({
+                    'status': 'ringing',
+                    'updated_at': now_iso
+                }).in_('id', internal_ids[start:start + INSERT_CHUNK_SIZE]).execute()
+            except Exception as e:
+                logger.error("[MOCK Bolna.ai] Error updating bulk call progression: %s", e)
+        
+        logger.info(
+            "[MOCK Bolna.ai] ✓ Bulk campaign completed: %d initiated, %d failed",
+            results['initiated'], results['failed']
+        )
         return results
     
     def get_call_status(self, call_id):
@@ -271,22 +356,28 @@ class MockVoiceService:
             return {"success": False, "error": "Mock mode disabled"}
         
         try:
-            response = self.supabase.table('call_logs').select('*').eq('call_id', call_id).execute()
+            response = self.supabase.table('call_logs') \
+                .select(CALL_STATUS_COLUMNS) \
+                .eq('call_id', call_id) \
+                .limit(1) \
+                .maybe_single() \
+                .execute()
             
-            if response.data:
-                call = response.data[0]
+            # Some supabase-py releases return None instead of an empty response
+            if response is not None and response.data:
+                call = response.data
                 return {
                     'success': True,
                     'call': {
                         'call_id': call['call_id'],
                         'status': call['status'],
-                        'to_number': call['to_number'],
+                        'to_number': call['phone'],
                         'agent_id': call['agent_id'],
                         'campaign_id': call.get('campaign_id'),
-                        'duration': call.get('duration'),
-                        'recording_url': call.get('metadata', {}).get('recording_url'),
-                        'transcript': call.get('metadata', {}).get('transcript'),
-                        'created_at': call['created_at'],
+                        'duration': call.get('duration_seconds'),
+                        'recording_url': (call.get('metadata') or {}).get('recording_url'),
+                        'transcript': (call.get('metadata') or {}).get('transcript'),
+                        'created_at': call['timestamp'],
                         'updated_at': call['updated_at']
                     }
                 }
@@ -294,7 +385,7 @@ class MockVoiceService:
                 return {"success": False, "error": "Call not found"}
                 
         except Exception as e:
-            print(f"[MOCK Bolna.ai] Error getting call status: {e}")
+            logger.error("[MOCK Bolna.ai] Error getting call status: %s", e)
             return {"success": False, "error": str(e)}
     
     def get_call_logs(self, limit=10, status=None):
@@ -303,7 +394,7 @@ class MockVoiceService:
             return []
         
         try:
-            query = self.supabase.table('call_logs').select('*').order('created_at', desc=True).limit(limit)
+            query = self.supabase.table('call_logs').select(CALL_LOG_COLUMNS).order('timestamp', desc=True).limit(limit)
             
             if status:
                 query = query.eq('status', status)
@@ -314,11 +405,11 @@ class MockVoiceService:
                 return [
                     {
                         'id': call['id'],
-                        'to_number': call['to_number'],
-                        'script_id': call['script_id'],
+                        'to_number': call['phone'],
+                        'script_id': call['call_script_id'],
                         'status': call['status'],
-                        'duration': call.get('duration'),
-                        'created_at': call['created_at']
+                        'duration': call.get('duration_seconds'),
+                        'created_at': call['timestamp']
                     }
                     for call in response.data
                 ]
@@ -327,30 +418,78 @@ class MockVoiceService:
                 return self._generate_mock_call_logs(limit)
                 
         except Exception as e:
-            print(f"Error getting call logs: {e}")
+            logger.error("Error getting call logs: %s", e)
             return self._generate_mock_call_logs(limit)
     
     def _generate_mock_call_logs(self, count):
         """Generate mock call logs for testing"""
-        mock_logs = []
-        for i in range(count):
-            call_id = str(uuid.uuid4())
-            status = random.choice(['completed', 'answered', 'busy', 'no_answer', 'failed'])
-            
-            if status in ['completed', 'answered']:
-                duration = random.randint(30, 300)
-            else:
-                duration = random.randint(5, 30)
-            
-            mock_logs.append({
-                'id': call_id,
+        rng = self._rng
+        # Draw every random column in one call each instead of per row
+        statuses = rng.choices(_OUTCOMES, k=count)
+        answered_durations = rng.choices(range(30, 301), k=count)
+        short_durations = rng.choices(range(5, 31), k=count)
+        script_numbers = rng.choices(range(1, 6), k=count)
+        hour_offsets = rng.choices(range(0, 73), k=count)
+        
+        # Only 73 distinct offsets exist, so format each timestamp once
+        now = datetime.utcnow()
+        timestamps = [(now - timedelta(hours=hours)).isoformat() for hours in range(73)]
+        
+        return [
+            {
+                'id': str(uuid.uuid4()),
                 'to_number': f"+123456789{i+1}",
-                'script_id': f"script_{random.randint(1, 5)}",
+                'script_id': f"script_{script_number}",
                 'status': status,
-                'duration': duration,
-                'created_at': (datetime.utcnow() - timedelta(hours=random.randint(0, 72))).isoformat()
-            })
-        return mock_logs
+                'duration': answered if status in ('completed', 'answered') else short,
+                'created_at': timestamps[hours]
+            }
+            for i, (status, answered, short, script_number, hours) in enumerate(
+                zip(statuses, answered_durations, short_durations, script_numbers, hour_offsets)
+            )
+        ]
+    
+    def _fetch_call_stats_row(self):
+        """
+        Aggregate call_logs into counts and duration totals
+        
+        Uses the get_call_stats() RPC so only a handful of scalars cross the
+        wire; falls back to reading status/duration_seconds columns if that migration
+        is not applied.
+        """
+        try:
+            response = self.supabase.rpc('get_call_stats').execute()
+            return response.data or {}
+        except Exception as e:
+            logger.warning("[MOCK Bolna.ai] get_call_stats RPC unavailable, aggregating locally: %s", e)
+        
+        response = self.supabase.table('call_logs').select('status, duration_seconds').execute()
+        calls = response.data or []
+        
+        # One pass over the rows for the status counts and completed durations
+        status_counts = Counter()
+        completed_duration_sum = 0
+        completed_duration_count = 0
+        total_seconds = 0
+        for call in calls:
+            status = call['status']
+            duration = call.get('duration_seconds') or 0
+            status_counts[status] += 1
+            total_seconds += duration
+            if status in _COMPLETED_STATUSES and duration:
+                completed_duration_sum += duration
+                completed_duration_count += 1
+        
+        return {
+            'total_calls': len(calls),
+            'completed_calls': sum(status_counts[s] for s in _COMPLETED_STATUSES),
+            'failed_calls': sum(status_counts[s] for s in _FAILED_STATUSES),
+            'active_calls': sum(status_counts[s] for s in _ACTIVE_STATUSES),
+            'average_duration_seconds': (
+                completed_duration_sum / completed_duration_count if completed_duration_count else 0
+            ),
+            'total_seconds': total_seconds
+        }
     
     def get_call_stats(self):
         """Get call statistics from database (Bolna.ai format)"""
@@ -358,55 +497,34 @@ class MockVoiceService:
             return {"success": False, "error": "Mock mode disabled"}
         
         try:
-            response = self.supabase.table('call_logs').select('*').execute()
+            row = self._fetch_call_stats_row()
             
-            if response.data:
-                calls = response.data
-                total_calls = len(calls)
-                completed_calls = len([c for c in calls if c['status'] in ['completed', 'answered']])
-                failed_calls = len([c for c in calls if c['status'] in ['busy', 'no_answer', 'failed']])
-                active_calls = len([c for c in calls if c['status'] in ['initiated', 'ringing', 'connected']])
-                
-                # Calculate average duration from completed calls
-                completed_with_duration = [c for c in calls if c.get('duration') and c['status'] in ['completed', 'answered']]
-                avg_duration = sum(c['duration'] for c in completed_with_duration) / len(completed_with_duration) if completed_with_duration else 0
-                total_minutes = sum(c.get('duration', 0) for c in calls) / 60
-                
-                return {
-                    'success': True,
-                    'total_calls': total_calls,
-                    'completed_calls': completed_calls,
-                    'failed_calls': failed_calls,
-                    'active_calls': active_calls,
-                    'success_rate': round((completed_calls / total_calls * 100) if total_calls > 0 else 0, 1),
-                    'average_duration_seconds': round(avg_duration, 1),
-                    'total_minutes': round(total_minutes, 1),
-                    'service': 'mock_bolna'
-                }
-            else:
-                return {
-                    'success': True,
-                    'total_calls': 0,
-                    'completed_calls': 0,
-                    'failed_calls': 0,
-                    'active_calls': 0,
-                    'success_rate': 0,
-                    'average_duration_seconds': 0,
-                    'total_minutes': 0,
-                    'service': 'mock_bolna'
-                }
+            total_calls = row.get('total_calls') or 0
+            completed_calls = row.get('completed_calls') or 0
+            
+            return {
+                'success': True,
+                'total_calls': total_calls,
+                'completed_calls': completed_calls,
+                'failed_calls': row.get('failed_calls') or 0,
+                'active_calls': row.get('active_calls') or 0,
+                'success_rate': round((completed_calls / total_calls * 100) if total_calls > 0 else 0, 1),
+                'average_duration_seconds': round(float(row.get('average_duration_seconds') or 0), 1),
+                'total_minutes': round(float(row.get('total_seconds') or 0) / 60, 1),
+                'service': 'mock_bolna'
+            }
                 
         except Exception as e:
-            print(f"[MOCK Bolna.ai] Error getting call stats: {e}")
+            logger.error("[MOCK Bolna.ai] Error getting call stats: %s", e)
             return {"success": False, "error": str(e)}
     
     def _generate_mock_stats(self):
         """Generate mock call statistics"""
-        total_calls = random.randint(50, 200)
-        completed_calls = int(total_calls * random.uniform(0.7, 0.9))
+        total_calls = self._rng.randint(50, 200)
+        completed_calls = int(total_calls * self._rng.uniform(0.7, 0.9))
         failed_calls = total_calls - completed_calls
         
-        avg_duration = random.uniform(60, 180)  # 1-3 minutes average
+        avg_duration = self._rng.uniform(60, 180)  # 1-3 minutes average
         
         return {
             'total_calls': total_calls,
@@ -459,9 +577,10 @@ class MockVoiceService:
             return None
         
         # Simulate campaign creation time
-        time.sleep(0.3 + random.uniform(0, 0.4))
+        self._simulate_delay(0.3, 0.7)
         
         campaign_id = str(uuid.uuid4())
+        now_iso = datetime.utcnow().isoformat()
         
         # Log campaign data
         campaign_data = {
@@ -473,8 +592,8 @@ class MockVoiceService:
             'completed_count': 0,
             'status': 'scheduled' if scheduled_time else 'created',
             'scheduled_time': scheduled_time,
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat(),
+            'created_at': now_iso,
+            'updated_at': now_iso,
             'metadata': {
                 'mock_mode': True,
                 'service': 'mock_bolna'
@@ -483,10 +602,10 @@ class MockVoiceService:
         
         self._log_to_supabase('call_campaigns', campaign_data)
         
-        print(f"[MOCK] Voice campaign created: {campaign_name}")
-        print(f"[MOCK] Campaign ID: {campaign_id}")
-        print(f"[MOCK] Contacts: {len(contacts)}")
-        print(f"[MOCK] Script: {script_id}")
+        logger.info(
+            "[MOCK] Voice campaign created: %s (Campaign ID: %s, Contacts: %d, Script: %s)",
+            campaign_name, campaign_id, len(contacts), script_id
+        )
         
         return {
             'campaign_id': campaign_id,
@@ -504,25 +623,26 @@ class MockVoiceService:
         try:
             # Generate mock recording URL
             recording_url = f"https://mock-recordings.bolna.ai/{call_id}.mp3"
+            now_iso = datetime.utcnow().isoformat()
             
             # Update call log with recording URL
             self.supabase.table('call_logs').update({
                 'recording_url': recording_url,
-                'updated_at': datetime.utcnow().isoformat(),
+                'updated_at': now_iso,
                 'metadata': {
                     'recording_generated': True,
                     'mock_recording': True
                 }
             }).eq('id', call_id).execute()
             
-            print(f"[MOCK] Call recording generated for {call_id}: {recording_url}")
+            logger.info("[MOCK] Call recording generated for %s: %s", call_id, recording_url)
             
             return {
                 'call_id': call_id,
                 'recording_url': recording_url,
-                'duration': random.randint(30, 300)
+                'duration': self._rng.randint(30, 300)
             }
             
         except Exception as e:
-            print(f"Error generating call recording: {e}")
+            logger.error("Error generating call recording: %s", e)
             return None
\ No newline at end of file
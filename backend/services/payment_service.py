@@ -35,3 +35,29 @@ class PaymentService:
         except Exception as e:
             print(f"Error creating payment link: {e}")
             return None
+
+
+# Global instance
+_payment_service_instance = None
+
+def get_payment_service():
+    """
+    Get global PaymentService instance (singleton pattern).
+    Uses mock service if MOCK_MODE is enabled.
+    
+    Returns:
+        PaymentService or MockPaymentService: Payment service instance
+    """
+    global _payment_service_instance
+    
+    if _payment_service_instance is None:
+        # Check if mock mode is enabled
+        if Config.MOCK_MODE:
+            from services.mock_payment_service import MockPaymentService
+            print("[Payment Service] Using MOCK Instamojo service (no real API calls)")
+            _payment_service_instance = MockPaymentService()
+        else:
+            print("[Payment Service] Using REAL Instamojo API")
+            _payment_service_instance = PaymentService()
+    
+    return _payment_service_instance
@@ -0,0 +1,52 @@
+"""
+JSON Provider
+
+Serializes Flask responses with orjson instead of the stdlib json module.
+"""
+
+from typing import Any
+from flask.json.provider import DefaultJSONProvider
+import orjson
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Drop-in Flask JSON provider backed by orjson
+
+    The wire format matches Flask's default provider: dates and datetimes
+    are passed through to Flask's default hook and serialized as RFC 822
+    strings. Types orjson cannot handle natively (Decimal, sets, objects
+    with __html__) use the same fallback. Calls with keyword arguments
+    orjson has no equivalent for (indent, separators, ...) are delegated to
+    the stdlib implementation.
+    """
+
+    # dumps() kwargs that map onto orjson options
+    _ORJSON_KWARGS = frozenset(('default', 'sort_keys'))
+
+    def _options(self, sort_keys: bool) -> int:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if not kwargs.keys() <= self._ORJSON_KWARGS:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(
+            obj,
+            default=kwargs.get('default', self.default),
+            option=self._options(kwargs.get('sort_keys', self.sort_keys)),
+        ).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._options(self.sort_keys)),
+            mimetype=self.mimetype,
+        )
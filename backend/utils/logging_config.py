@@ -0,0 +1,55 @@
+"""
+Logging Configuration
+
+Routes all application logging through a QueueHandler so that log I/O is
+performed by a background QueueListener thread instead of the request path.
+"""
+
+from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import logging
+import queue
+import threading
+
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+def configure_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Configure the root logger with a non-blocking queue handler
+
+    Safe to call multiple times; the listener is only started once.
+
+    Args:
+        level: Root logger level
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        log_queue: queue.Queue = queue.Queue(-1)
+
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        root = logging.getLogger()
+        root.setLevel(level)
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(QueueHandler(log_queue))
+
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        return _listener
@@ -1,6 +1,24 @@
-from supabase import create_client, Client
+from functools import lru_cache
+import httpx
+from supabase import create_client, Client, ClientOptions
 from config import Config
 
+# Shared keep-alive pool so batch logging reuses connections instead of
+# paying a TLS handshake per request
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0)
+HTTP_TIMEOUT_SECONDS = 10.0
+
+def _client_options() -> ClientOptions:
+    try:
+        return ClientOptions(
+            postgrest_client_timeout=HTTP_TIMEOUT_SECONDS,
+            httpx_client=httpx.Client(limits=HTTP_POOL_LIMITS, timeout=HTTP_TIMEOUT_SECONDS),
+        )
+    except TypeError:
+        # Older supabase-py releases do not accept a custom httpx client
+        return ClientOptions(postgrest_client_timeout=HTTP_TIMEOUT_SECONDS)
+
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     url = Config.SUPABASE_URL
     key = Config.SUPABASE_SERVICE_KEY
@@ -8,6 +26,6 @@ def get_supabase_client() -> Client:
     if not url or not key:
         raise ValueError("Supabase credentials not found in environment variables.")
         
-    return create_client(url, key)
+    return create_client(url, key, options=_client_options())
 
 supabase = get_supabase_client()
@@ -0,0 +1,47 @@
+-- Migration: 0027_certificate_jobs
+-- Description: Track certificates rendered in the background worker
+-- Created: 2026-10-16
+
+-- Create certificate_jobs table
+CREATE TABLE IF NOT EXISTS certificate_jobs (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    certificate_id varchar(50) UNIQUE NOT NULL,
+    student_id uuid REFERENCES profiles(id) ON DELETE CASCADE NOT NULL,
+    course_name text NOT NULL,
+    status varchar(20) DEFAULT 'pending' CHECK (status IN ('pending', 'processing', 'completed', 'failed')),
+    file_url text,
+    error text,
+    requested_by uuid REFERENCES profiles(id) ON DELETE SET NULL,
+    created_at timestamptz DEFAULT now(),
+    updated_at timestamptz DEFAULT now()
+);
+
+COMMENT ON TABLE certificate_jobs IS 'Background certificate generation requests and their progress';
+COMMENT ON COLUMN certificate_jobs.certificate_id IS 'Certificate identifier reserved at enqueue time (CERT-YYYYMMDD-XXXXXXXX)';
+COMMENT ON COLUMN certificate_jobs.status IS 'Job status: pending, processing, completed, failed';
+
+-- Indexes for efficient queries
+CREATE INDEX IF NOT EXISTS idx_certificate_jobs_status ON certificate_jobs(status) WHERE status IN ('pending', 'processing');
+CREATE INDEX IF NOT EXISTS idx_certificate_jobs_student ON certificate_jobs(student_id);
+
+-- Trigger to update updated_at timestamp
+DROP TRIGGER IF EXISTS update_certificate_jobs_updated_at ON certificate_jobs;
+CREATE TRIGGER update_certificate_jobs_updated_at
+    BEFORE UPDATE ON certificate_jobs
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Row Level Security (RLS)
+ALTER TABLE certificate_jobs ENABLE ROW LEVEL SECURITY;
+
+-- Policy: Admins can view all certificate jobs
+CREATE POLICY "Admins can view all certificate jobs"
+    ON certificate_jobs
+    FOR SELECT
+    USING (
+        EXISTS (
+            SELECT 1 FROM profiles
+            WHERE profiles.id = auth.uid()
+            AND profiles.role = 'admin'
+        )
+    );
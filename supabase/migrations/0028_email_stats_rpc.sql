@@ -0,0 +1,26 @@
+-- Migration: 0028_email_stats_rpc
+-- Description: Aggregate email_logs delivery stats in a single statement
+-- Created: 2026-10-16
+
+-- Returns total/sent/failed counts and the latest send time without
+-- shipping every email_logs row to the application
+create or replace function public.email_stats()
+returns jsonb
+language sql
+stable
+security definer
+as $$
+  select jsonb_build_object(
+    'total', count(*),
+    'sent', count(*) filter (where status = 'sent'),
+    'failed', count(*) filter (where status = 'failed'),
+    'last_sent', max(sent_at)
+  )
+  from public.email_logs;
+$$;
+
+-- Grant execute permissions to authenticated users
+grant execute on function public.email_stats() to authenticated;
+
+-- Add comment
+comment on function public.email_stats() is 'Returns email_logs totals (total, sent, failed, last_sent) for the email stats endpoint';
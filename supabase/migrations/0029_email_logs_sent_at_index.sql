@@ -0,0 +1,7 @@
+-- Migration: 0029_email_logs_sent_at_index
+-- Description: Index the latest-send lookup used by the email stats endpoint
+-- Created: 2026-10-16
+
+-- Serves max(sent_at) in email_stats() and the
+-- "order by sent_at desc limit 1" fallback as a single index probe
+CREATE INDEX IF NOT EXISTS idx_email_logs_sent_at ON email_logs(sent_at DESC) WHERE sent_at IS NOT NULL;
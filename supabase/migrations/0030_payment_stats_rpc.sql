@@ -0,0 +1,34 @@
+-- Migration: 0030_payment_stats_rpc
+-- Description: Aggregate payment link stats server-side for the admin dashboard
+-- Created: 2026-10-16
+
+-- Covering index so the grouped aggregate reads status/amount from the index only
+CREATE INDEX IF NOT EXISTS idx_payments_status_amount ON public.payments(status) INCLUDE (amount);
+
+-- Returns request counts and amounts per gateway status in one statement.
+-- status is compared as text because mock payments use Instamojo's
+-- Credit/Pending/Failed values; complete_payment() stores the
+-- paid/pending/failed enum values, so both spellings are counted
+create or replace function public.get_payment_stats()
+returns jsonb
+language sql
+stable
+security definer
+as $$
+  select jsonb_build_object(
+    'total_requests', count(*),
+    'total_paid', count(*) filter (where status::text in ('Credit', 'paid')),
+    'total_pending', count(*) filter (where status::text in ('Pending', 'pending')),
+    'total_failed', count(*) filter (where status::text in ('Failed', 'failed')),
+    'total_amount', coalesce(sum(amount), 0),
+    'paid_amount', coalesce(sum(amount) filter (where status::text in ('Credit', 'paid')), 0),
+    'pending_amount', coalesce(sum(amount) filter (where status::text in ('Pending', 'pending')), 0)
+  )
+  from public.payments;
+$$;
+
+-- Grant execute permissions to authenticated users
+grant execute on function public.get_payment_stats() to authenticated;
+
+-- Add comment
+comment on function public.get_payment_stats() is 'Returns payment request counts and amounts by status for the payment stats endpoint';
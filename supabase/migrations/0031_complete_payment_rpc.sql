@@ -0,0 +1,56 @@
+-- Migration: 0031_complete_payment_rpc
+-- Description: Apply payment completions and webhooks in a single atomic update
+-- Created: 2026-10-16
+
+-- Sets the payment status, records the external payment id and merges
+-- p_metadata into the existing metadata server-side, returning the updated row.
+-- Replaces a select + client-side merge + update, which could lose
+-- concurrent webhook writes. Returns no rows when the link is unknown.
+--
+-- p_status accepts Instamojo's Credit/Pending/Failed labels as well as the
+-- payment_status enum values, and is resolved to the enum before the update.
+create or replace function public.complete_payment(
+  p_payment_link_id text,
+  p_status text,
+  p_payment_id text default null,
+  p_metadata jsonb default '{}'::jsonb
+)
+returns setof public.payments
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  v_status public.payment_status;
+begin
+  v_status := case lower(p_status)
+    when 'credit' then 'paid'
+    when 'paid' then 'paid'
+    when 'failed' then 'failed'
+    when 'pending' then 'pending'
+  end;
+
+  if v_status is null then
+    raise exception 'Unknown payment status: %', p_status
+      using errcode = '22023';
+  end if;
+
+  return query
+  update public.payments
+  set status = v_status,
+      external_payment_id = coalesce(p_payment_id, external_payment_id),
+      metadata = coalesce(metadata, '{}'::jsonb) || p_metadata,
+      updated_at = timezone('utc', now())
+  where payment_link_id = p_payment_link_id
+  returning *;
+end;
+$$;
+
+-- Mutating and bypasses RLS: only the backend's service role may call it
+revoke execute on function public.complete_payment(text, text, text, jsonb)
+from public, anon, authenticated;
+
+grant execute on function public.complete_payment(text, text, text, jsonb)
+to service_role;
+
+comment on function public.complete_payment(text, text, text, jsonb) is 'Atomically completes a payment link and merges webhook metadata';
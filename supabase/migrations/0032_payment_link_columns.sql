@@ -0,0 +1,24 @@
+-- Migration: 0032_payment_link_columns
+-- Description: Promote frequently read payment link fields out of metadata JSONB
+-- Created: 2026-10-16
+
+-- metadata is kept for cold audit data (mock flags, webhook payloads)
+ALTER TABLE public.payments
+ADD COLUMN IF NOT EXISTS metadata JSONB DEFAULT '{}'::jsonb,
+ADD COLUMN IF NOT EXISTS shorturl TEXT,
+ADD COLUMN IF NOT EXISTS redirect_url TEXT,
+ADD COLUMN IF NOT EXISTS webhook_url TEXT,
+ADD COLUMN IF NOT EXISTS external_payment_id TEXT;
+
+-- Backfill from rows written before the split
+UPDATE public.payments
+SET shorturl = coalesce(shorturl, metadata->>'shorturl'),
+    redirect_url = coalesce(redirect_url, metadata->>'redirect_url'),
+    webhook_url = coalesce(webhook_url, metadata->>'webhook_url'),
+    external_payment_id = coalesce(external_payment_id, metadata->>'external_payment_id')
+WHERE metadata ?| array['shorturl', 'redirect_url', 'webhook_url', 'external_payment_id'];
+
+COMMENT ON COLUMN public.payments.shorturl IS 'Short payment link shown in listings';
+COMMENT ON COLUMN public.payments.redirect_url IS 'Where the gateway sends the buyer after payment';
+COMMENT ON COLUMN public.payments.webhook_url IS 'Gateway webhook callback URL';
+COMMENT ON COLUMN public.payments.external_payment_id IS 'Gateway payment ID once the link is paid';
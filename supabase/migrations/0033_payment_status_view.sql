@@ -0,0 +1,46 @@
+-- Migration: 0033_payment_status_view
+-- Description: Serve Instamojo-shaped payment status rows, including the nested payments array
+-- Created: 2026-10-16
+
+-- complete_payment() maintains updated_at; make sure it exists for the view
+ALTER TABLE public.payments
+ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc', now());
+
+-- One row per payment link, already in the payment_request response shape
+CREATE OR REPLACE VIEW payment_status_v
+WITH (security_invoker = true) AS
+SELECT
+  payment_link_id AS id,
+  -- complete_payment() stores the payment_status enum; report Instamojo labels
+  CASE status::text
+    WHEN 'paid' THEN 'Credit'
+    WHEN 'pending' THEN 'Pending'
+    WHEN 'failed' THEN 'Failed'
+    ELSE status::text
+  END AS status,
+  to_char(amount, 'FM9999999990.00') AS amount,
+  purpose,
+  buyer_name,
+  email,
+  phone,
+  payment_url AS longurl,
+  created_at,
+  CASE
+    WHEN status::text IN ('Credit', 'paid') AND external_payment_id IS NOT NULL THEN jsonb_build_array(
+      jsonb_build_object(
+        'payment_id', external_payment_id,
+        'amount', to_char(amount, 'FM9999999990.00'),
+        'status', 'Credit',
+        'buyer_name', buyer_name,
+        'buyer_email', email,
+        'buyer_phone', phone,
+        'created_at', coalesce(updated_at, created_at)
+      )
+    )
+    ELSE '[]'::jsonb
+  END AS payments
+FROM public.payments
+WHERE payment_link_id IS NOT NULL;
+
+-- Grant access to the view
+GRANT SELECT ON payment_status_v TO authenticated;
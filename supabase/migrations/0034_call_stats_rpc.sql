@@ -0,0 +1,35 @@
+-- Migration: 0034_call_stats_rpc
+-- Description: Aggregate voice call stats server-side for the automation dashboard
+-- Created: 2026-10-16
+
+-- Returns call counts by outcome group plus duration totals in one statement.
+-- plpgsql so the body binds to the columns written by the voice service at call time
+create or replace function public.get_call_stats()
+returns jsonb
+language plpgsql
+stable
+security definer
+as $$
+declare
+  result jsonb;
+begin
+  select jsonb_build_object(
+    'total_calls', count(*),
+    'completed_calls', count(*) filter (where status::text in ('completed', 'answered')),
+    'failed_calls', count(*) filter (where status::text in ('busy', 'no_answer', 'failed')),
+    'active_calls', count(*) filter (where status::text in ('initiated', 'ringing', 'connected')),
+    'average_duration_seconds', coalesce(avg(duration_seconds) filter (where status::text in ('completed', 'answered') and duration_seconds > 0), 0),
+    'total_seconds', coalesce(sum(duration_seconds), 0)
+  )
+  into result
+  from public.call_logs;
+
+  return result;
+end;
+$$;
+
+-- Grant execute permissions to authenticated users
+grant execute on function public.get_call_stats() to authenticated;
+
+-- Add comment
+comment on function public.get_call_stats() is 'Returns voice call totals, outcome counts and durations for the call stats endpoint';
@@ -0,0 +1,79 @@
+-- Migration: 0035_log_outbound_call_rpc
+-- Description: Record an outbound voice call and its CRM message in one request
+-- Created: 2026-10-16
+
+-- Columns the voice service tracks per call alongside the 0004 schema
+ALTER TABLE public.call_logs
+ADD COLUMN IF NOT EXISTS call_id text,
+ADD COLUMN IF NOT EXISTS agent_id text,
+ADD COLUMN IF NOT EXISTS campaign_id text,
+ADD COLUMN IF NOT EXISTS metadata jsonb DEFAULT '{}'::jsonb,
+ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc', now());
+
+COMMENT ON COLUMN public.call_logs.call_id IS 'Voice provider call ID (call_xxxxxxxxxxxxxxxx)';
+COMMENT ON COLUMN public.call_logs.agent_id IS 'Voice agent that placed the call';
+COMMENT ON COLUMN public.call_logs.campaign_id IS 'Bulk campaign the call belongs to, if any';
+
+-- In-progress and outcome states reported by the voice provider
+ALTER TYPE call_status ADD VALUE IF NOT EXISTS 'initiated';
+ALTER TYPE call_status ADD VALUE IF NOT EXISTS 'ringing';
+ALTER TYPE call_status ADD VALUE IF NOT EXISTS 'connected';
+ALTER TYPE call_status ADD VALUE IF NOT EXISTS 'answered';
+ALTER TYPE call_status ADD VALUE IF NOT EXISTS 'no_answer';
+ALTER TYPE call_status ADD VALUE IF NOT EXISTS 'busy';
+
+-- Inserts the call_logs row and its crm_messages mirror in a single
+-- transaction, replacing two sequential inserts from the voice service.
+-- Only the listed keys are read; anything the payload omits falls back to
+-- the column default.
+create or replace function public.log_outbound_call(
+  p_call jsonb,
+  p_crm jsonb
+)
+returns void
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+  insert into public.call_logs (
+    id, user_id, phone, status, call_id, agent_id, campaign_id, metadata, timestamp, updated_at
+  )
+  values (
+    coalesce((p_call->>'id')::uuid, gen_random_uuid()),
+    (p_call->>'user_id')::uuid,
+    p_call->>'phone',
+    coalesce((p_call->>'status')::public.call_status, 'initiated'),
+    p_call->>'call_id',
+    p_call->>'agent_id',
+    p_call->>'campaign_id',
+    coalesce(p_call->'metadata', '{}'::jsonb),
+    coalesce((p_call->>'timestamp')::timestamptz, timezone('utc', now())),
+    coalesce((p_call->>'updated_at')::timestamptz, timezone('utc', now()))
+  );
+
+  insert into public.crm_messages (
+    id, user_id, channel, sender, message, external_message_id, delivery_status, metadata, timestamp
+  )
+  values (
+    coalesce((p_crm->>'id')::uuid, gen_random_uuid()),
+    (p_crm->>'user_id')::uuid,
+    coalesce((p_crm->>'channel')::public.crm_channel, 'call'),
+    coalesce((p_crm->>'sender')::public.crm_sender, 'admin'),
+    p_crm->>'message',
+    p_crm->>'external_message_id',
+    coalesce(p_crm->>'delivery_status', 'sent'),
+    coalesce(p_crm->'metadata', '{}'::jsonb),
+    coalesce((p_crm->>'timestamp')::timestamptz, timezone('utc', now()))
+  );
+end;
+$$;
+
+-- Writes past RLS: only the backend's service role may call it
+revoke execute on function public.log_outbound_call(jsonb, jsonb)
+from public, anon, authenticated;
+
+grant execute on function public.log_outbound_call(jsonb, jsonb)
+to service_role;
+
+comment on function public.log_outbound_call(jsonb, jsonb) is 'Atomically logs an outbound call and its CRM message';
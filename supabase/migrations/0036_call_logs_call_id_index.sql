@@ -0,0 +1,6 @@
+-- Migration: 0036_call_logs_call_id_index
+-- Description: Index the provider call id used by voice call status lookups
+-- Created: 2026-10-16
+
+-- Serves the "where call_id = ? limit 1" lookup in get_call_status
+CREATE INDEX IF NOT EXISTS idx_call_logs_call_id ON call_logs(call_id);